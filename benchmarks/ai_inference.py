@@ -0,0 +1,53 @@
+"""compares the cpu latency and the output drift of the inference modes of sketchpy.models against the
+eager float32 model, run it with `python benchmarks/ai_inference.py image.jpg [style_index] [runs] [batch_size]`"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sketchpy.models import model_manager, MODES
+
+
+def measure(manager, images, style_index=3, runs=5):
+    """returns (list of seconds per run, outputs of the last run as uint8 arrays), the first call converts
+    the model and is not timed"""
+    manager.cartoonize(images, style_index, len(images))
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = manager.cartoonize(images, style_index, len(images))
+        times.append(time.perf_counter() - start)
+    return times, [np.asarray(img, dtype=np.int16) for img in out]
+
+
+def main(image, style_index=3, runs=5, batch_size=1, modes=MODES):
+    from PIL import Image
+
+    images = [Image.open(image).convert("RGB")] * batch_size
+    reference = None
+    for mode in modes:
+        try:
+            times, out = measure(model_manager(mode=mode), images, style_index, runs)
+        except ImportError as e:
+            print(f"{mode:>13}: skipped, {e}")
+            continue
+        times.sort()
+        if reference == None:
+            reference = out
+        drift = np.abs(np.stack(out) - np.stack(reference))
+        print(
+            f"{mode:>13}: best {times[0] * 1000:.0f} ms, median {times[len(times) // 2] * 1000:.0f} ms per batch of {batch_size}, "
+            f"drift from eager mean {drift.mean():.2f} max {drift.max()} (0-255)"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    style_index = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    batch_size = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+    main(sys.argv[1], style_index, runs, batch_size)
@@ -0,0 +1,49 @@
+"""measures how long `import sketchpy.canvas` takes in a fresh interpreter and which heavy
+dependencies it loads, run it with `python benchmarks/import_time.py [module] [runs]`"""
+import os
+import subprocess
+import sys
+
+
+HEAVY = ("torch", "cv2", "svgpathtools", "svg", "tqdm", "winsound", "PIL.ImageGrab", "pkg_resources")
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(module="sketchpy.canvas"):
+    """returns (seconds, list of heavy modules loaded) for one import in a new process"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    res = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module, heavy=HEAVY)],
+        capture_output=True,
+        text=True,
+        cwd=root,
+    )
+    if res.returncode != 0:
+        raise RuntimeError(res.stderr.strip().splitlines()[-1])
+    seconds, loaded = res.stdout.splitlines()[-2:]
+    return float(seconds), [m for m in loaded.split(",") if m]
+
+
+def main(module="sketchpy.canvas", runs=5):
+    times = []
+    loaded = []
+    for _ in range(runs):
+        seconds, loaded = measure(module)
+        times.append(seconds)
+    times.sort()
+    print(f"import {module}: best {times[0] * 1000:.1f} ms, median {times[len(times) // 2] * 1000:.1f} ms over {runs} runs")
+    print(f"heavy modules loaded: {', '.join(loaded) if loaded else 'none'}")
+    return 1 if loaded else 0
+
+
+if __name__ == "__main__":
+    module = sys.argv[1] if len(sys.argv) > 1 else "sketchpy.canvas"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sys.exit(main(module, runs))
@@ -1,16 +1,79 @@
 import os
-import turtle
 import xml.etree.ElementTree as ET
-from svg.path import parse_path
+import numpy as np
+from .renderer import turtle_renderer, frame_counter
+from .cache import get_cache
+from .reporting import log, ERROR
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+def flatten_path(path, tol):
+    """
+    Flattens the drawing segments of a parsed SVG path into polylines.
+
+    :param path: A svg.path Path.
+    :param tol: Maximum distance between a curve and its polyline, in SVG units.
+    :return: (points, offsets), points is a (n, 2) float array, segment i is points[offsets[i]:offsets[i + 1]].
+    """
+    from svg.path import Move
+    from .sampling import sample_segments
+
+    # move commands do not draw anything
+    pts, offsets = sample_segments([segment for segment in path if not isinstance(segment, Move)], tol)
+    return np.stack([pts.real, pts.imag], axis=1), offsets
+
+
+def flatten_svg(svg_file, tolerance=0.001):
+    """
+    Parses an SVG once and flattens every path segment into a polyline.
+
+    :param svg_file: Path to the SVG file.
+    :param tolerance: Maximum distance between a curve and its polyline, as a fraction of the
+        largest side of the viewBox, 0.001 stays below a pixel in the 800x600 window of Hendry.
+    :return: A dict with points, a (n, 2) float32 array in SVG coordinates, offsets, segment i is
+        points[offsets[i]:offsets[i + 1]] and is drawn in colors[i], colors and the view_box.
+    """
+    from svg.path import parse_path
+
+    root = ET.parse(svg_file).getroot()
+
+    viewBox = root.get("viewBox")
+    if viewBox:
+        view_box = tuple(map(float, viewBox.split()))
+    else:
+        view_box = (0, 0, float(root.get("width", "800")), float(root.get("height", "600")))
+    tol = tolerance * max(view_box[2], view_box[3])
+
+    points, lengths, colors = [], [], []
+    for path_elem in root.findall('.//' + SVG_NS + 'path'):
+        try:
+            path = parse_path(path_elem.get('d'))
+        except Exception as e:
+            log("Error parsing path:", e, level=ERROR)
+            continue
+        pts, offs = flatten_path(path, tol)
+        points.append(pts)
+        lengths.extend(np.diff(offs).tolist())
+        colors.extend([path_elem.get('fill', "#000000")] * (len(offs) - 1))
+
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    points = np.concatenate(points).astype(np.float32) if points else np.zeros((0, 2), dtype=np.float32)
+    return {"points": points, "offsets": offsets, "colors": np.array(colors, dtype=str), "view_box": np.array(view_box)}
+
 
 class Hendry:
-    def __init__(self, svg_file=None, x_offset=0, y_offset=0):
+    def __init__(self, svg_file=None, x_offset=0, y_offset=0, renderer=None, cache=None):
         """
         Initializes the turtle screen and loads the default SVG if no file is provided.
 
         :param svg_file: Optional path to an SVG file. If None, uses the default.
         :param x_offset: Optional additional x offset.
         :param y_offset: Optional additional y offset.
+        :param renderer: Optional drawing backend (see sketchpy.renderer). If None, a turtle window is used.
+        :param cache: True keeps the flattened paths in the shared on-disk cache, None (default) or False
+            disables it, or a sketchpy.cache.preprocess_cache object.
         """
         # If no file is provided, use the default one inside the package
         if svg_file is None:
@@ -19,92 +82,116 @@ class Hendry:
         self.svg_file = svg_file
         self.x_offset = x_offset
         self.y_offset = y_offset
+        self.cache = cache
+        self.tolerance = 0.001
 
-        self.screen = turtle.Screen()
-        self.screen.setup(width=800, height=600)
-        self.screen.tracer(6)
-
-        self.pen = turtle.Turtle()
-        self.pen.shape("arrow")
-        self.pen.speed(10)  # Slower speed for smoother animation
-        self.pen.width(10)
+        if renderer is None:
+            renderer = turtle_renderer(speed=10, shape="arrow")  # Slower speed for smoother animation
+        self.renderer = renderer
+        self.renderer.setup(800, 600)
+        self.renderer.tracer(6)
+        self.renderer.width(10)
+        self.frames = frame_counter(self.renderer)
 
         self.load_svg()
 
     def load_svg(self):
-        """Loads the SVG file and prepares for drawing."""
+        """
+        Loads the SVG file and prepares for drawing.
+        The paths are flattened once into polylines and kept in the cache, keyed on the content of the file,
+        so loading it again, at any size or offset, skips the parsing.
+        """
+        self.points = None
+        cache = get_cache(self.cache)
         try:
-            tree = ET.parse(self.svg_file)
-            self.root = tree.getroot()
+            if cache is not None:
+                key = cache.key("Hendry", self.svg_file, tolerance=self.tolerance)
+                entry = cache.get(key)
+                if entry is None:
+                    entry = cache.put(
+                        key,
+                        lambda d: np.savez(os.path.join(d, "polylines.npz"), **flatten_svg(self.svg_file, self.tolerance)),
+                    )
+                with np.load(os.path.join(entry, "polylines.npz"), allow_pickle=False) as f:
+                    data = {name: f[name] for name in f.files}
+            else:
+                data = flatten_svg(self.svg_file, self.tolerance)
         except Exception as e:
-            print("Error loading SVG file:", e)
-            self.root = None
+            log("Error loading SVG file:", e, level=ERROR)
+            self.points = None
             return
 
-        viewBox = self.root.get("viewBox")
-        if viewBox:
-            parts = viewBox.split()
-            self.vb_x, self.vb_y, self.vb_width, self.vb_height = map(float, parts)
-        else:
-            self.vb_x = 0
-            self.vb_y = 0
-            self.vb_width = float(self.root.get("width", "800"))
-            self.vb_height = float(self.root.get("height", "600"))
-
-        sw = self.screen.window_width()
-        sh = self.screen.window_height()
+        self.points, self.offsets, self.colors = data["points"], data["offsets"], data["colors"]
+        self.vb_x, self.vb_y, self.vb_width, self.vb_height = map(float, data["view_box"])
+
+        sw = self.renderer.window_width()
+        sh = self.renderer.window_height()
         self.scale = min(sw / self.vb_width, sh / self.vb_height)
 
     def transform(self, x, y):
         """
         Transforms SVG coordinates to turtle screen coordinates.
+        x and y can also be NumPy arrays.
         """
         new_x = (x - self.vb_x) * self.scale - (self.vb_width * self.scale) / 2 + self.x_offset
         new_y = (self.vb_height * self.scale) / 2 - (y - self.vb_y) * self.scale + self.y_offset
         return new_x, new_y
 
+    def screen_points(self):
+        """
+        The flattened points mapped to screen coordinates with a single affine transform.
+        """
+        pts = np.empty(self.points.shape)
+        pts[:, 0], pts[:, 1] = self.transform(self.points[:, 0], self.points[:, 1])
+        return pts
+
     def draw_path(self, d, color="#000000", thickness=2):
         """
         Draws an SVG path with turtle without drawing an extra connecting line
         between segments.
         """
+        from svg.path import parse_path
+
         try:
             path = parse_path(d)
         except Exception as e:
-            print("Error parsing path:", e)
+            log("Error parsing path:", e, level=ERROR)
             return
 
-        self.pen.color(color)
-        self.pen.width(thickness)
-
-        for segment in path:
-            # Lift the pen and move to the start of the segment to avoid connecting lines
-            pt_start = segment.point(0)
-            start_x, start_y = self.transform(pt_start.real, pt_start.imag)
-            self.pen.penup()
-            self.pen.goto(start_x, start_y)
-            self.pen.pendown()
-
-            seg_length = segment.length(error=1e-2)
-            steps = max(int(seg_length / 2), 10)
-            for i in range(steps + 1):
-                pt = segment.point(i / steps)
-                new_x, new_y = self.transform(pt.real, pt.imag)
-                self.pen.goto(new_x, new_y)
-
-    def draw(self):
-        """Draws the default or user-provided SVG."""
-        if self.root is None:
-            print("SVG file not loaded.")
+        self.renderer.color(color)
+        self.renderer.width(thickness)
+
+        pts, offsets = flatten_path(path, self.tolerance * max(self.vb_width, self.vb_height))
+        pts[:, 0], pts[:, 1] = self.transform(pts[:, 0], pts[:, 1])
+        for n in range(len(offsets) - 1):
+            self.renderer.polyline(pts[offsets[n] : offsets[n + 1]].tolist())
+            self.frames.tick()
+
+    def draw(self, update_every=None):
+        """
+        Draws the default or user-provided SVG.
+
+        :param update_every: None keeps the default animation, n refreshes the screen once every n segments,
+            "instant" draws everything and refreshes once.
+        """
+        if self.points is None:
+            log("SVG file not loaded.", level=ERROR)
             return
 
-        # Iterate through all SVG path elements
-        for path_elem in self.root.findall('.//{http://www.w3.org/2000/svg}path'):
-            d = path_elem.get('d')
-            fill = path_elem.get('fill', "#000000")
-            self.draw_path(d, color=fill, thickness=2)
+        self.frames = frame_counter(self.renderer, update_every)
+
+        pts = self.screen_points()
+        color = None
+        self.renderer.width(2)
+        for n in range(len(self.offsets) - 1):
+            if self.colors[n] != color:
+                color = str(self.colors[n])
+                self.renderer.color(color)
+            self.renderer.polyline(pts[self.offsets[n] : self.offsets[n + 1]].tolist())
+            self.frames.tick()
 
-        turtle.done()
+        self.frames.finish()
+        self.renderer.done()
 
 # Example usage when running this module directly.
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+import glob
+import os
+import time
+from functools import partial
+
+from .pipeline import imap_ordered
+from .reporting import configure, log, settings, ERROR
+
+
+MODES = ("trace", "sketch", "svg")
+
+
+def expand_inputs(inputs):
+    """a glob pattern, a file path or a list of them -> sorted list of files"""
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    files = []
+    for item in inputs:
+        matches = sorted(glob.glob(item))
+        files.extend(matches if len(matches) else [item])
+    return files
+
+
+def input_root(files):
+    """the deepest folder holding all the files, the outputs keep the folders of the inputs below it"""
+    if len(files) == 0:
+        return None
+    return os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files])
+
+
+def output_name(path, root=None):
+    """name of the output of path without its extension, the path relative to root, or the file name without root"""
+    if root == None:
+        return os.path.splitext(os.path.basename(path))[0]
+    return os.path.relpath(os.path.splitext(os.path.abspath(path))[0], root)
+
+
+def check_names(files, root):
+    """raises a ValueError when two inputs would write the same output, like face.jpg and face.png"""
+    seen = {}
+    for path in files:
+        name = os.path.normcase(output_name(path, root))
+        if name in seen:
+            raise ValueError(f"{seen[name]} and {path} would write the same output {output_name(path, root)}")
+        seen[name] = path
+
+
+def process_file(path, mode, output, output_dir, options, verbosity=ERROR, root=None):
+    """runs one input through the preprocessing stage of mode and writes the result to output_dir,
+    returns a dict with the input, the output file, the time taken and the error if it failed\n
+    verbosity -> verbosity of the canvas classes while processing the file (see sketchpy.reporting)\n
+    root -> folder the inputs are relative to, the output keeps the folders of path below it, see input_root"""
+    from . import canvas
+    from .renderer import raster_renderer
+
+    out = os.path.join(output_dir, output_name(path, root) + (".png" if output == "image" else ".npy"))
+    start = time.perf_counter()
+    previous = settings["verbosity"]
+    configure(verbosity=verbosity)
+    try:
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        renderer = raster_renderer()
+        if mode == "trace":
+            obj = canvas.trace_from_image(path, renderer=renderer, save=False, **options)
+            if output == "image":
+                obj.draw()
+            else:
+                obj.prepare().save(out)
+        elif mode == "sketch":
+            obj = canvas.sketch_from_image(path, save=False, renderer=renderer)
+            if output == "image":
+                obj.draw(**options)
+            else:
+                obj.prepare(**options).save(out)
+        else:
+            options = dict(options)
+            options.setdefault("no_of_processes", 1)
+            obj = canvas.color_sketch_from_svg(path, renderer=renderer, save=False, **options)
+            if output == "image":
+                obj.draw(retain=False)
+            elif obj.load_svg(os.path.splitext(out)[0]) is None:
+                raise ValueError("could not load the svg data")
+        if output == "image":
+            renderer.save(out)
+        error = None
+    except Exception as e:
+        out = None
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        configure(verbosity=previous)
+    return {"input": path, "output": out, "seconds": time.perf_counter() - start, "error": error}
+
+
+def process_images(inputs, output_dir, mode="trace", output="paths", workers=None, verbosity=ERROR, **options):
+    """processes many images (or svg files) without opening any window\n
+    inputs -> list of files or glob patterns, like "uploads/*.jpg"\n
+    output_dir -> folder the results are written to, one file per input named after its path relative to the
+    folder holding all the inputs, so a/face.jpg and b/face.jpg are written to a/face and b/face\n
+    mode -> "trace" (trace_from_image), "sketch" (sketch_from_image) or "svg" (color_sketch_from_svg)\n
+    output -> "paths" writes the prepared path data as .npy, "image" renders the sketch to a .png\n
+    workers -> no of worker processes, defaults to the no of cores, 1 runs everything in this process\n
+    verbosity -> what the canvas classes report while processing a file, only errors by default so the logs
+    of many files do not interleave, the one line summary of every file is always reported\n
+    options -> passed on to the class (trace and svg modes) or to draw/prepare (sketch mode)\n
+
+    returns one dict per input with the keys input, output, seconds and error, in the order of the inputs"""
+    if mode not in MODES:
+        raise ValueError(f"mode should be one of {MODES}")
+    if output not in ("paths", "image"):
+        raise ValueError('output should be "paths" or "image"')
+    files = expand_inputs(inputs)
+    root = input_root(files)
+    check_names(files, root)
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == None:
+        workers = os.cpu_count() or 1
+
+    fn = partial(
+        process_file, mode=mode, output=output, output_dir=output_dir, options=options, verbosity=verbosity, root=root
+    )
+    results = []
+    failed = 0
+    for res in imap_ordered(fn, files, min(workers, max(len(files), 1))):
+        results.append(res)
+        if res["error"] != None:
+            failed += 1
+            log(f"{res['input']} failed after {res['seconds']:.2f}s: {res['error']}", level=ERROR)
+        else:
+            log(f"{res['input']} -> {res['output']} in {res['seconds']:.2f}s")
+    log(f"processed {len(results) - failed} of {len(results)} files, {failed} failed")
+    return results
+
+
+def cartoonize_images(inputs, output_dir, style_index=3, batch_size=4, models=None):
+    """runs the AnimeGAN step of ai_sketch_from_image on many images, the model is loaded once and the
+    images are converted batch_size at a time\n
+    inputs -> list of files or glob patterns, like "uploads/*.jpg"\n
+    output_dir -> folder the converted images are written to, as <name>.jpg, keeping the folders of the inputs
+    like process_images\n
+    style_index -> [0-3] style of the conversion, see ai_sketch_from_image\n
+    models -> model_manager to use (see sketchpy.models), the shared one by default\n
+
+    returns one dict per input with the keys input, output, seconds and error, in the order of the inputs"""
+    from PIL import Image
+    from .models import get_models
+
+    files = expand_inputs(inputs)
+    root = input_root(files)
+    check_names(files, root)
+    os.makedirs(output_dir, exist_ok=True)
+    manager = get_models(models)
+    results = []
+    for n in range(0, len(files), batch_size):
+        start = time.monotonic()
+        batch = []
+        for path in files[n : n + batch_size]:
+            res = {"input": path, "output": None, "seconds": 0.0, "error": None}
+            try:
+                batch.append((res, Image.open(path).convert("RGB")))
+            except Exception as e:
+                res["error"] = str(e)
+                log(f"{path} failed: {e}", level=ERROR)
+            results.append(res)
+        if len(batch) == 0:
+            continue
+        try:
+            images = manager.cartoonize([img for _, img in batch], style_index, batch_size)
+        except Exception as e:
+            for res, _ in batch:
+                res["error"] = str(e)
+            log(f"batch of {len(batch)} images failed: {e}", level=ERROR)
+            continue
+        seconds = (time.monotonic() - start) / len(batch)
+        for (res, _), img in zip(batch, images):
+            res["output"] = os.path.join(output_dir, output_name(res["input"], root) + ".jpg")
+            res["seconds"] = seconds
+            os.makedirs(os.path.dirname(res["output"]), exist_ok=True)
+            img.save(res["output"])
+            log(f"{res['input']} -> {res['output']} in {seconds:.2f}s")
+    failed = sum(res["error"] != None for res in results)
+    log(f"converted {len(results) - failed} of {len(results)} images, {failed} failed")
+    return results
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+
+def file_hash(file_path, block_size=1 << 20):
+    """sha256 of the content of the file"""
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class preprocess_cache:
+    def __init__(self, directory=None, max_size=1 << 30):
+        """on-disk cache of preprocessed data, entries are keyed on the content of the input file and the
+        parameters used to process it, so renaming or touching a file does not invalidate them\n
+        directory -> where the entries are stored, defaults to $SKETCHPY_CACHE_DIR or ~/.cache/sketchpy\n
+        max_size -> size limit in bytes, the least recently used entries are removed once it is exceeded"""
+        if directory == None:
+            directory = os.environ.get(
+                "SKETCHPY_CACHE_DIR",
+                os.path.join(os.path.expanduser("~"), ".cache", "sketchpy"),
+            )
+        self.directory = directory
+        self.max_size = max_size
+
+    def key(self, kind, file_path, **params):
+        """key of the entry holding the result of the processing step kind, run on file_path with params"""
+        h = hashlib.sha256()
+        h.update(kind.encode())
+        h.update(file_hash(file_path).encode())
+        for name in sorted(params):
+            h.update(f"|{name}={params[name]!r}".encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        """returns the directory of the entry, or None when it is not cached"""
+        entry = os.path.join(self.directory, key)
+        if not os.path.isdir(entry):
+            return None
+        now = time.time()
+        os.utime(entry, (now, now))
+        return entry
+
+    def put(self, key, writer):
+        """writer(directory) writes the files of the entry, the entry only shows up once it is complete,
+        returns the directory of the entry"""
+        os.makedirs(self.directory, exist_ok=True)
+        entry = os.path.join(self.directory, key)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        try:
+            writer(tmp)
+            os.replace(tmp, entry)
+        except OSError:
+            # another process stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self.evict()
+        return entry
+
+    def entries(self):
+        """list of (last use, size in bytes, directory) of every entry"""
+        res = []
+        if not os.path.isdir(self.directory):
+            return res
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(entry):
+                continue
+            size = 0
+            for file in os.listdir(entry):
+                size += os.path.getsize(os.path.join(entry, file))
+            res.append((os.path.getmtime(entry), size, entry))
+        return res
+
+    def evict(self):
+        """removes the least recently used entries until the cache fits in max_size"""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        for _, _, entry in self.entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+default_cache = None
+
+
+def get_cache(cache=None):
+    """None or False -> no caching, True -> the shared default cache (capped at 1 GB), or a preprocess_cache object,
+    the cache is opt-in so nothing is written to the home directory unless it is asked for"""
+    global default_cache
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        if default_cache == None:
+            default_cache = preprocess_cache()
+        return default_cache
+    return cache
@@ -1,23 +1,28 @@
-import multiprocessing as mp
-from tqdm import tqdm
 import numpy as np
-import turtle as tu
 import os
-import cv2
-import sys
+import shutil
 import subprocess
-from svgpathtools import svg2paths2
-from svg.path import parse_path
-from PIL import ImageGrab
-import pkg_resources
-import torch
-from PIL import Image
-import warnings
-warnings.filterwarnings("ignore", message="TypedStorage is deprecated")
-import winsound
+from .renderer import get_renderer, frame_counter
+from .pipeline import hex_to_rgb, sample_svg
+from .pathcache import path_data, read_paths, split_paths, load_paths, save_contours, load_contours
+from .cache import get_cache
+from .reporting import log, progress_bar, track, ERROR, DEBUG
+from .coords import parse_coords, split_markers, load_strokes, write_companion
+from .simplify import simplify_paths
+from .ordering import reorder_paths
+from .tiling import tiled_sketch, TILE_SIZE, MIN_TILED_PIXELS
 
 
 
+def play_sound():
+    """plays the system sound once a sketch is finished, only available on windows"""
+    try:
+        import winsound
+    except ImportError:
+        return
+    winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
+
+
 def get_svg(image_path, output_path=None):
     '''Usage: \n
     from sketchpy import canvas
@@ -28,6 +33,8 @@ def get_svg(image_path, output_path=None):
 
    
 
+    import pkg_resources
+
     exe_path = pkg_resources.resource_filename('sketchpy', 'files/trace.exe')
     try:
         if output_path != None:
@@ -36,7 +43,7 @@ def get_svg(image_path, output_path=None):
             subprocess.run([exe_path, image_path], shell=True)
 
     except Exception as e:
-        print("An error occurred:", e)
+        log("An error occurred:", e, level=ERROR)
 
 
 class trace:
@@ -48,13 +55,15 @@ class trace:
         img_path - path of the image to be traced\n
         zoom - zoom of the image\n
         scale - scale of the original image"""
+        import cv2
+
         self.coordinates = []
         self.scale_x, self.scale_y = scale, scale
         self.zoom_scale_x, self.zoom_scale_y = zoom, zoom
         self.cx, self.cy = (self.zoom_scale_x * 100) // 2, (
             self.zoom_scale_y * 100
         ) // 2
-        print(
+        log(
             "----- USE RIGHT CLICK TO CREATE A TRACE POINT -----\n----- USE LEFT CLICK TO REMOVE A TRACE POINT -----\n----- ONCE FINISHED PRESS ANY BUTTON TO SAVE YOUR DATA -----"
         )
 
@@ -63,18 +72,21 @@ class trace:
         self.color_li = []
 
     def click_event(self, event, x, y, flag, params):
+        import cv2
+
         if event == cv2.EVENT_LBUTTONDOWN:
-            print(x, " ", y)
+            log(x, " ", y, level=DEBUG)
             self.coordinates.append((x, y))
-            print(self.img[x][y])
+            log(self.img[x][y], level=DEBUG)
             self.color_li.append(tuple(self.img[x][y]))
             temp = cv2.circle(
                 self.img, (x, y), radius=1, color=(0, 255, 255), thickness=-1
             )
         if event == cv2.EVENT_RBUTTONDOWN:
-            print(f"poping {x} and {y}")
-            print(
-                f"coord : {self.coordinates[-1]}\n color : {tuple(self.color_li[-1])}"
+            log(f"poping {x} and {y}", level=DEBUG)
+            log(
+                f"coord : {self.coordinates[-1]}\n color : {tuple(self.color_li[-1])}",
+                level=DEBUG,
             )
             temp = cv2.circle(
                 self.img,
@@ -87,16 +99,17 @@ class trace:
                 ),
                 thickness=-1,
             )
-            print(
-                f"actual col {self.img[x][y]} : changed img {int(self.color_li[-1][0]),int(self.color_li[-1][1]),int(self.color_li[-1][2])}"
+            log(
+                f"actual col {self.img[x][y]} : changed img {int(self.color_li[-1][0]),int(self.color_li[-1][1]),int(self.color_li[-1][2])}",
+                level=DEBUG,
             )
             # print('img:',img[y,x,:])
 
             self.coordinates.pop()
             self.color_li.pop()
         if event == cv2.EVENT_MBUTTONDOWN:
-            print("mouse wheel pressed")
-            print("creating break point")
+            log("mouse wheel pressed")
+            log("creating break point")
             self.coordinates.append((-1, -1))
         try:
             zoom = cv2.resize(
@@ -109,14 +122,16 @@ class trace:
             zoom[self.cx - 3 : self.cx + 3, self.cx - 3 : self.cx + 3, :] = 175
             cv2.imshow("zoom", zoom)
         except:
-            print("out of range!!")
+            log("out of range!!")
 
     def trace(self):
+        import cv2
+
         cv2.imshow("Main image", self.img)
         cv2.setMouseCallback("Main image", self.click_event)
         cv2.waitKey(0)
         cv2.destroyAllWindows()
-        print(self.coordinates)
+        log(self.coordinates, level=DEBUG)
 
         if len(self.coordinates) > 0:
             from os.path import exists
@@ -126,24 +141,24 @@ class trace:
             path_exists = exists(f"./{file}.txt")
 
             if path_exists:
-                print(f"the file {file} already exists!!!")
+                log(f"the file {file} already exists!!!")
                 des = input("do you what to append the data: (y/n) ")
                 if des == "y" or des == "Y":
                     data = open(f"{file}.txt", "a")
-                    print("creating a break point and appending....")
+                    log("creating a break point and appending....")
                     data.write(str((-1, -1)) + "\n")
                     for i in self.coordinates:
                         # x,y = i
                         data.write(str(i) + "\n")
-                    print(f"all the coordinates are save in {file}")
+                    log(f"all the coordinates are save in {file}")
                     data.close()
                 else:
-                    print("deleting all the data and writing.....")
+                    log("deleting all the data and writing.....")
                     data = open(f"{file}.txt", "w")
                     for i in self.coordinates:
                         x, y = i
                         data.write(str(i) + "\n")
-                    print(f"all the coordinates are save in {file}")
+                    log(f"all the coordinates are save in {file}")
                     data.close()
 
             else:
@@ -151,104 +166,88 @@ class trace:
                 for i in self.coordinates:
                     x, y = i
                     data.write(str(i) + "\n")
-                print(f"all the coordinates are save in {file}")
+                log(f"all the coordinates are save in {file}")
                 data.close()
 
+            # binary copy of the coordinates, loaded by sketch.draw_fn without parsing the text file
+            write_companion(file, *self.img.shape[:2])
+
         else:
-            print("no coordinates are detected to be saved...")
+            log("no coordinates are detected to be saved...")
 
 
 
 class sketch:
 
-    def __init__(self, x_offset=300, y_offset=300, save=False):
+    def __init__(self, x_offset=300, y_offset=300, save=False, renderer=None):
         """Draw the traced image with help of this sketch function\n
         x-offset - postion of the image in x axis\n
         y-offset - postion of the image in y axis\n
+        renderer - backend used to draw (turtle by default, use renderer.raster_renderer() to draw without a window)\n
         call the draw_fn() to draw the traced image"""
-        self.pen = tu.Turtle()
-        self.pen.speed(0)
+        self.renderer = get_renderer(renderer)
         self.x_offset = x_offset
         self.y_offset = y_offset
         self.save = save
 
     def get_coord(self, data):
-        tu = []
-        for i in data.readlines():
-            i = (i.strip("\n")).strip("(").strip(")")
-            tu.append(tuple(map(int, i.split(","))))
-
-        return tu
-
-    def go(self, x, y):
-        self.pen.penup()
-        self.pen.goto(x - self.x_offset, (y * -1) + self.y_offset)
-        self.pen.pendown()
-
-    def paint(self, coord, co=(0, 0, 0)):
-        self.pen.color(co)
-        t_x, t_y = coord[0]
-        self.go(t_x, t_y)
-        self.pen.fillcolor(co)
-        self.pen.begin_fill()
-        t = 0
-        for i in coord[1:]:
-            print(i)
-            x, y = i
-            if t:
-                self.go(x, y)
-                t = 0
-                self.pen.begin_fill()
-                continue
-            if x == -1 and y == -1:
-                t = 1
-                self.pen.end_fill()
-                continue
-            else:
-                self.pen.goto(x - self.x_offset, (y * -1) + self.y_offset)
-        self.pen.end_fill()
-
-    def draw_fn(self, file, mode=1, co=(0, 0, 0), thickness=1, retain=False):
-        """file - path of the file which contains the coordinates\n
+        """parses an open coordinate file into a list of (x, y)"""
+        return [tuple(p) for p in parse_coords(data).tolist()]
+
+    def segments(self, coord):
+        """splits the coordinates on the (-1, -1) break points, returns a list of segments in screen coordinates"""
+        return self.to_screen(*split_markers(coord))
+
+    def to_screen(self, points, offsets):
+        """maps strokes given as (points, offsets) to a list of segments in screen coordinates"""
+        screen = np.empty((len(points), 2), dtype=np.int64)
+        screen[:, 0] = points[:, 0]
+        screen[:, 0] -= self.x_offset
+        screen[:, 1] = self.y_offset
+        screen[:, 1] -= points[:, 1]
+        screen = screen.tolist()
+        return [screen[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    def paint(self, coord, co=(0, 0, 0), frames=None, segs=None):
+        self.renderer.color(co)
+        if segs == None:
+            segs = self.segments(coord)
+        for seg in segs:
+            self.renderer.polygon(seg)
+            if frames != None:
+                frames.tick()
+
+    def draw_fn(self, file, mode=1, co=(0, 0, 0), thickness=1, retain=False, update_every=None):
+        """file - path of the file which contains the coordinates, without the extension, file.npy written by
+        trace.trace is used when it is up to date, otherwise file.txt is parsed\n
         mode - mode of drawing (1 - sketch with line, 0 - fill with color)\n
         co - color of the line or fill\n
         thickness - thickness of the line\n
-        retain - retain the image drawn after executing"""
+        retain - retain the image drawn after executing\n
+        update_every - None animates every line, n refreshes the screen once every n lines, "instant" refreshes once at the end"""
 
         co = (co[0] / 255, co[1] / 255, co[2] / 255)
 
-        self.pen.color(co)
-        data = open(f"{file}.txt", "r")
-        coord = self.get_coord(data)
+        self.renderer.color(co)
+        segs = self.to_screen(*load_strokes(file))
 
-        self.pen.width(thickness)
+        self.renderer.width(thickness)
+        frames = frame_counter(self.renderer, update_every)
         if mode:
-            t_x, t_y = coord[0]
-            self.go(t_x, t_y)
-            t = 0
-            for i in coord[1:]:
-                print(i)
-                x, y = i
-                if t:
-                    self.go(x, y)
-                    t = 0
-                    continue
-                if x == -1 and y == -1:
-                    t = 1
-                    continue
-                else:
-                    self.pen.goto(x - self.x_offset, (y * -1) + self.y_offset)
+            for seg in segs:
+                self.renderer.polyline(seg)
+                frames.tick()
         else:
-            self.paint(coord=coord, co=co)
+            self.paint(coord=None, co=co, frames=frames, segs=segs)
+        frames.finish()
 
         if self.save:
-            image = ImageGrab.grab()
-            image.save("sketch.png")
-            print("your sketch is saved as sketch.png!!")
+            self.renderer.save("sketch.png")
+            log("your sketch is saved as sketch.png!!")
 
 
         if retain:
-            tu.done()
+            self.renderer.done()
 
 
 
@@ -271,6 +270,7 @@ class ascii_art:
             ".": "grey",
         },
         save=True,
+        renderer=None,
     ):
         """example usage:
         from sketchpy import canvas
@@ -284,6 +284,7 @@ class ascii_art:
         chars = list of characters to be used from convertion of image to ASCII art
         color_set = dictionary map for specific character to a specific color
         save = takes a screen shot of the entire screen and saves it
+        renderer = where to draw, a turtle window by default (see sketchpy.renderer)
 
         """
         self.x_len = x_len
@@ -291,126 +292,103 @@ class ascii_art:
         self.chars = chars
         self.colo_set = color_set
         self.save = save
+        self.renderer = renderer
 
-    def convert_to_acsii(self, img_path, file_name=None) -> str:
-        """Converts the given image to ascii art and save it to output_file, returns string
+    def to_array(self, img_path, width=80):
+        """Converts the given image to a (rows, width) array of characters
         img_path = path of the image
-        file_name = name of the output text file"""
+        width = no of characters per line"""
 
         from PIL import Image
 
-        # pass the image as command line argument
         img = Image.open(img_path)
 
         # resize the image
-        width, height = img.size
-        aspect_ratio = height / width
-        new_width = 80
-        new_height = aspect_ratio * new_width * 0.55
-        img = img.resize((new_width, int(new_height)))
-        # new size of image
-        # print(img.size)
+        w, h = img.size
+        aspect_ratio = h / w
+        new_height = aspect_ratio * width * 0.55
+        img = img.resize((width, int(new_height)))
 
         # convert image to greyscale format
-        img = img.convert("L")
+        pixels = np.asarray(img.convert("L"))
 
-        pixels = img.getdata()
+        # replace each pixel with a character from the palette
+        palette = np.array(self.chars)
+        return palette[pixels // 25]
 
-        # replace each pixel with a character from array
-        chars = self.chars
-        new_pixels = [chars[pixel // 25] for pixel in pixels]
-        new_pixels = "".join(new_pixels)
-
-        # split string of chars into multiple strings of length equal to the new width and create a list
-        new_pixels_count = len(new_pixels)
-        ascii_image = [
-            new_pixels[index : index + new_width]
-            for index in range(0, new_pixels_count, new_width)
-        ]
-        n_chars = len(ascii_image[0])
+    def convert_to_acsii(self, img_path, file_name=None, width=80) -> str:
+        """Converts the given image to ascii art and save it to output_file, returns string
+        img_path = path of the image
+        file_name = name of the output text file
+        width = no of characters per line"""
 
-        self.half_width = n_chars * self.x_len * -1
+        chars = self.to_array(img_path, width)
+        self.half_width = chars.shape[1] * self.x_len * -1
 
-        ascii_image = "\n".join(ascii_image)
+        ascii_image = "\n".join("".join(row) for row in chars.tolist())
 
         # write to a text file.
         if file_name != None:
             with open(f"{file_name}.txt", "w") as f:
                 f.write(ascii_image)
-        print(ascii_image)
+        log(ascii_image)
         return ascii_image
 
-    def load_data(self, file_path=None, img_path=None, raw_data=None):
+    def load_data(self, file_path=None, img_path=None, raw_data=None, width=80):
         """used to load a previously processed image,
         file_path = path of the ascii art txt file
         img_path = path of the image
-        raw_data = sting containing the ascii art"""
+        raw_data = sting containing the ascii art
+        width = no of characters per line when converting an image"""
 
         if img_path != None:
-            self.data = self.convert_to_acsii(img_path)
+            self.data = self.convert_to_acsii(img_path, width=width)
         elif file_path != None:
             re = open(file_path, "r")
             self.data = re.readlines()
         elif raw_data != None:
             self.data = raw_data
-            print("sepcify the correct data")
+            log("sepcify the correct data")
             return
         return self.data
 
-    def draw(self, data=None):
-        # setting the x and y coordinates
-        s_x = self.half_width
-        s_y = 250
-
+    def draw(self, data=None, update_every=None):
+        """draws the loaded ascii art, every character is its own dash of x_len pixels followed by a gap of x_len pixels,
+        the dashes are not merged, they are only batched: one renderer.lines call draws all the dashes of a color on a line,
+        so the pen color changes once per color instead of once per character\n
+        data -> ascii art as a string or a list of lines, the loaded data is used when not given\n
+        update_every -> None animates every character, n refreshes once every n characters, "instant" refreshes once at the end"""
         if data != None:
             self.data = data
-
-        p = tu.Pen()
-        p.speed(0)
-        tu.bgcolor("black")
-        p.up()
-        p.width(2)
-        p.goto(s_x, s_y)
-        p.down()
-
-        # function to select the color
-        def set_col(c):
-            chars = self.colo_set
-            col = chars[c]
-            p.pencolor(col)
-            return col
-
-        for i in self.data:
-
-            if i == "\n":
-                p.up()
-                p.goto(self.half_width, s_y - self.y_len)
-                s_y -= self.y_len
-                s_x = self.half_width
-                p.down()
-                continue
-            else:
-                col = set_col(i)
-                if col == "black":
-                    s_x += 2 * self.x_len
-                    p.up()
-                    p.goto(s_x, s_y)
-                    continue
-                else:
-                    p.down()
-                    s_x += self.x_len
-                    p.goto(s_x, s_y)
-
-                    s_x += self.x_len
-                    p.up()
-                    p.goto(s_x, s_y)
-                    p.down()
+        lines = self.data.split("\n") if isinstance(self.data, str) else self.data
+        if not hasattr(self, "half_width"):
+            self.half_width = max([len(line.rstrip("\n")) for line in lines] + [0]) * self.x_len * -1
+
+        renderer = get_renderer(self.renderer, hide=True)
+        renderer.bgcolor("black")
+        renderer.width(2)
+        frames = frame_counter(renderer, update_every)
+
+        # every character takes 2 * x_len, the first half is drawn and the second half is the gap to the next one,
+        # the runs only group the characters of a color, each one is still drawn as a separate segment
+        for col, runs in char_runs(lines, self.colo_set, skip=("black",)).items():
+            renderer.color(col)
+            rows, cols = run_cells(*runs)
+            ys = (250 - rows * self.y_len).tolist()
+            x0 = (self.half_width + 2 * self.x_len * cols).tolist()
+            x1 = (self.half_width + 2 * self.x_len * cols + self.x_len).tolist()
+            line_ends = np.flatnonzero(np.diff(rows, append=-1)) + 1
+            first = 0
+            for last in line_ends.tolist():
+                renderer.lines([((x0[n], ys[n]), (x1[n], ys[n])) for n in range(first, last)])
+                frames.tick(last - first)
+                first = last
+        frames.finish()
         if self.save:
-            image = ImageGrab.grab()
-            image.save("sketch.png")
-            print("your sketch is saved as sketch.png!!")
-        winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
-        tu.done()
+            renderer.save("sketch.png")
+            log("your sketch is saved as sketch.png!!")
+        play_sound()
+        renderer.done()
 
     def print_to_terminal(self):
         for i in self.data:
@@ -428,14 +406,22 @@ class color_sketch_from_svg:
         x_offset=0,
         y_offset=0,
         save=True,
+        renderer=None,
+        tolerance=0.5,
+        cache=None,
+        simplify=None,
     ):
         """
         path -> path of the svg file\n
-        no_of_processes -> on of simultanious threads to process the SVG file faster(set it to the no of cores in the system, default value: 4)\n
+        no_of_processes -> no of worker processes used to process the SVG file faster (set it to the no of cores in the system, 1 processes it without any worker, default value: 4)\n
         scale -> zoom value\n
         x_offset -> amount of movemnt in x direction\n
         y_offset -> amount of movemnt in y direction\n
         save -> True = take a screenshot and save it\n
+        renderer -> backend used to draw (turtle by default, use renderer.raster_renderer() to draw without a window)\n
+        tolerance -> maximum distance in pixels between the svg curves and the sampled points, lower values sample more points\n
+        cache -> True keeps the sampled paths in the shared cache so the same svg is not sampled again, or a cache.preprocess_cache object, None (default) or False disables it\n
+        simplify -> maximum distance in pixels between the sampled paths and the simplified ones drawn, 0 only removes duplicate and collinear points, None (default) keeps every sampled point\n
 
         used to sketch an colored image from a svg file,  reffer my youtube channel to know more about it
         """
@@ -445,66 +431,38 @@ class color_sketch_from_svg:
         self.scale = scale
         self.save = save
         self.no_of_processes =  no_of_processes
+        self.renderer = renderer
+        self.tolerance = tolerance
+        self.cache = cache
+        self.simplify = simplify
 
 
     def hex_to_rgb(self, string):
-        strlen = len(string)
-        # print(string)
-        if string.startswith("#"):
-            if strlen == 7:
-                r = string[1:3]
-                g = string[3:5]
-                b = string[5:7]
-            elif strlen == 4:
-                r = string[1:2] * 2
-                g = string[2:3] * 2
-                b = string[3:4] * 2
-        elif strlen == 3:
-            r = string[0:1] * 2
-            g = string[1:2] * 2
-            b = string[2:3] * 2
-        else:
-            r = string[0:2]
-            g = string[2:4]
-            b = string[4:6]
-
-        return int(r, 16) / 255, int(g, 16) / 255, int(b, 16) / 255
+        return hex_to_rgb(string)
 
-    def process(self,data, id, queue):
-        try:
-            for i in tqdm(data):
-                path = parse_path(i["d"])
-                # co = i["style"].replace("fill: ", "").replace(";", "")
-                co = i["fill"]
-
-                col = self.hex_to_rgb(co)
-                transform = i["transform"].replace("translate(", "").replace(")", "")
-                transform = list(map(float, transform.split(",")))
-                transform = list(map(int, transform))
-                n = str(path).split(" ")
-                n = len(n) // 5 - 10
-                if n <= 20:
-                    n = 20
-                pts = [
-                    (
-                        (int(((p.real + transform[0]) / self.width) * self.scale))
-                        - self.x_offset,
-                        (int(((p.imag + transform[1]) / self.height) * self.scale))
-                        - self.y_offset,
-                    )
-                    for p in (path.point(i / n) for i in range(1, n + 1))
-                ]
-
-                queue.put((pts, col))
-        except Exception as e:
-            print(f"Error : {e}")  
-
-    def load_svg(self, file_name=os.path.abspath(sys.argv[0])):
-        """file_name -> name of the npy array, you can use this array data to sketch images directly"""
+    def cached_svg(self, entry, file_name=None):
+        self.res = load_paths(os.path.join(entry, "paths.npy"))
+        self.height, self.width = self.res.height, self.res.width
+        log("loaded the svg data from the cache")
+        if file_name != None:
+            self.res.save(file_name + ".npy")
+        return self.res
+
+    def load_svg(self, file_name=None):
+        """file_name -> name of the npy file to save the data to, you can use this file to sketch images directly with draw(file=...)\n
+        returns the sampled paths as a path_data object, they are also kept in the cache so loading the same svg again is instant"""
+        cache = get_cache(self.cache)
+        if cache != None and self.path != None:
+            key = cache.key("color_sketch_from_svg", self.path, scale=self.scale, tolerance=self.tolerance, x_offset=self.x_offset, y_offset=self.y_offset, simplify=self.simplify)
+            entry = cache.get(key)
+            if entry != None:
+                return self.cached_svg(entry, file_name)
         if self.path != None:
+            from svgpathtools import svg2paths2
+
             paths, attributes, svg_att = svg2paths2(self.path)
             self.attr = attributes
-        print("loding svg data...")
+        log("loding svg data...")
         try:
             try:
                 h = svg_att["height"]
@@ -532,59 +490,42 @@ class color_sketch_from_svg:
             if self.y_offset == 0:
                 self.y_offset = (self.width) // 2
 
-            self.res = []
             try:
-                self.res.append([self.height, self.width, self.scale])
-                def divide_list(lst, n):
-                    division = len(lst) / n
-                    return [lst[int(round(division * i)): int(round(division * (i + 1)))] for i in range(n)]
-
-
-                div_list = divide_list(attributes, self.no_of_processes)
-                processes = []
-                queue = mp.Queue()
-                for num, i in enumerate(div_list):
-                    p = mp.Process(target= self.process, args= ( i, num, queue ))
-                    p.start()
-
-                    processes.append(p)
-
-                while True:
-                    if not any(p.is_alive() for p in processes) and queue.empty():
-                        break  # If all processes finished and queue is empty, break the loop
-                    while not queue.empty():
-                        data_received = queue.get() 
-                        self.res.append(data_received)
-
-                    
-                for p in processes:
-                    p.join()
-
-                # temp = [self.res]
-
-                # for num in range(self.no_of_processes):
-                #     temp.append(np.load(f"{num}.npy", allow_pickle=True))
-                # self.res = np.concatenate(temp, axis=0)
-                np_array = np.array(self.res)
-                np.save(file_name+".npy", np_array, allow_pickle=True)
+                with progress_bar(len(attributes), "sampling paths") as bar:
+                    self.points, self.offsets, self.colors, self.breaks = sample_svg(
+                        attributes,
+                        self.width,
+                        self.height,
+                        self.scale,
+                        self.tolerance,
+                        post_offset=(self.x_offset, self.y_offset),
+                        workers=self.no_of_processes,
+                        progress=bar.update,
+                    )
+                if self.simplify != None:
+                    self.points, self.offsets, self.breaks = simplify_paths(self.points, self.offsets, self.simplify, self.breaks)
+                self.res = path_data(self.points, self.offsets, self.colors, self.height, self.width, self.scale, self.breaks)
+                if file_name != None:
+                    self.res.save(file_name + ".npy")
+                if cache != None:
+                    cache.put(key, lambda entry: self.res.save(os.path.join(entry, "paths.npy")))
                 return self.res
 
             except Exception as e:
-                print(e)
-                print(f"Error : {e}")
-                print("youtube : https://www.youtube.com/c/CODEHUB03")
+                log(e, level=ERROR)
+                log(f"Error : {e}", level=ERROR)
+                log("youtube : https://www.youtube.com/c/CODEHUB03", level=ERROR)
                 return None
         except Exception as e:
-            print("error found!!!")
-            print(f"ERROR: {e}")
-            print(
-                """you can contact me on my youtube channel: https://www.youtube.com/c/codehub03 \\n discord : https://discord.gg/r2KFa73PM2 \\n instagram : https://www.instagram.com/mr.m_y_s_t_e_r_y/"""
+            log("error found!!!", level=ERROR)
+            log(f"ERROR: {e}", level=ERROR)
+            log(
+                """you can contact me on my youtube channel: https://www.youtube.com/c/codehub03 \\n discord : https://discord.gg/r2KFa73PM2 \\n instagram : https://www.instagram.com/mr.m_y_s_t_e_r_y/""",
+                level=ERROR,
             )
 
     def move_to(self, x, y):
-        self.pen.up()
-        self.pen.goto(x, y)
-        self.pen.down()
+        self.renderer.move_to(x, y)
 
     def draw(
         self,
@@ -594,92 +535,99 @@ class color_sketch_from_svg:
         x_offset=0,
         y_offset=0,
         scale=None,
-        speed=1,
+        speed=None,
+        allow_pickle=False,
+        update_every=None,
     ):
         """
         retain -> retain the window after sketching\n
         file -> file path of the npy file for direct sketching\n
-        data -> raw data,  should be a list in [[[x1,y1], [x2,y2], ....], [255,255,255]], first nested list is the points and the second list the color\n
+        data -> raw data,  should be a list in [[[x1,y1], [x2,y2], ....], [255,255,255]], first nested list is the points and the second list the color, or a path_data object returned by load_svg\n
         x_offset -> amount of movement in x direction while sketching\n
         y_offset -> amount of movement in y direction while sketching\n
         scale -> zoom value while sketching\n
-        speed -> speed of sketching"""
+        speed -> no longer used, use update_every instead\n
+        allow_pickle -> allow loading npy files saved by older versions of sketchpy, only use it for files you trust\n
+        update_every -> None refreshes the screen once every path, n once every n paths, "instant" refreshes once at the end"""
         if file != None:
-            coordinates = np.load(file, allow_pickle=True)
-            print(f"datas are loaded from {file}")
-        elif data != None:
+            coordinates = read_paths(file, allow_pickle)
+            log(f"datas are loaded from {file}")
+        elif data is not None:
             coordinates = data
         else:
             coordinates = self.load_svg()
-            if coordinates == None:
+            if coordinates is None:
                 return 0
-        wn = tu.Screen()
-        wn.tracer(0)
-        self.pen = tu.Turtle()
-        self.pen.speed(0)
-        self.screen = tu.Screen()
-        dimension = coordinates[0]
+        self.renderer = get_renderer(self.renderer)
+        if speed != None:
+            log("speed is no longer used, use update_every to control how often the screen is refreshed")
+            if update_every == None:
+                update_every = speed
+        frames = frame_counter(self.renderer, 1 if update_every == None else update_every)
+        dimension, paths = split_paths(coordinates)
         height = dimension[0]
         width = dimension[1]
 
         if scale == None:
-            try:
-                scale = dimension[2]
-
-            except:
+            scale = dimension[2]
+            if scale == None:
                 scale = self.scale
 
         else:
-            print(f"scaling the image by the factor of :{scale}")
-
-        print("sketching...")
-
-        for n_path, path_col in enumerate(tqdm(coordinates[1:])):
-            f = 1
-            self.pen.color("black")
-            path = path_col[0]
-            col = path_col[1]
-            self.pen.color(col)
-            self.pen.begin_fill()
-
-            for num, coord in enumerate(path):
-                x, y = coord
-                x, y = (int((x * scale) / height)) - x_offset, (
-                    int((y * scale) / width)
-                ) - y_offset
-                y *= -1
-                if f:
-                    self.pen.end_fill()
-                    self.move_to(x, y)
-                    self.pen.begin_fill()
-
-                    f = 0
-
-                elif coord in path[num + 1 :]:
-                    self.pen.end_fill()
-                    self.move_to(x, y)
-                    self.pen.begin_fill()
+            log(f"scaling the image by the factor of :{scale}")
 
-                else:
-                    self.pen.goto(x, y)
-            self.pen.end_fill()
-            if n_path % speed == 0:
-                wn.update()
+        fit_renderer(
+            self.renderer,
+            (paths.points[:, 0] * scale / height).astype(int) - x_offset,
+            (paths.points[:, 1] * scale / width).astype(int) - y_offset,
+        )
+
+        log("sketching...")
+
+        for n_path in track(range(len(paths)), stage="sketching"):
+            self.renderer.color(tuple(paths.colors[n_path].tolist()))
+
+            for sub in paths.subpaths(n_path):
+                x = (sub[:, 0] * scale / height).astype(int) - x_offset
+                y = (sub[:, 1] * scale / width).astype(int) - y_offset
+                self.renderer.polygon(list(zip(x.tolist(), (-y).tolist())))
+            frames.tick()
+        frames.finish()
 
         if self.save:
-            image = ImageGrab.grab()
-            image.save("sketch.png")
-            print("your sketch is saved as sketch.png!!")
+            self.renderer.save("sketch.png")
+            log("your sketch is saved as sketch.png!!")
 
         if retain == True:
-            print("done sketching")
-            winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
-            tu.done()
+            log("done sketching")
+            play_sound()
+            self.renderer.done()
+
+
+
+def fit_renderer(renderer, x, y, margin=20):
+    """asks the renderer for a canvas that holds the points x, y around (0, 0), so the raster renderer does not crop them"""
+    if len(x):
+        renderer.screensize(2 * int(np.abs(x).max()) + margin, 2 * int(np.abs(y).max()) + margin)
+
 
+def contour_mean(img, contour):
+    """mean color of img inside the filled contour, the mask only covers the bounding box of the
+    contour instead of the whole image"""
+    import cv2
+
+    x, y, w, h = cv2.boundingRect(contour)
+    mask = np.zeros((h, w), dtype=np.uint8)
+    cv2.drawContours(mask, [contour], 0, (255), thickness=cv2.FILLED, offset=(-x, -y))
+    mean = cv2.mean(img[y : y + h, x : x + w], mask=mask)
+    if img.ndim == 2:
+        # the tiled preprocessing keeps a single channel of the grey image
+        return (mean[0], mean[0], mean[0], 0)
+    return mean
 
 
 class trace_from_image:
-    def __init__(self, path, scale=0.75, intensity=170, save=False, details=50, blur=51, skip_frequency=10):
+    def __init__(self, path, scale=0.75, intensity=170, save=False, details=50, blur=51, skip_frequency=10, renderer=None, cache=None, simplify=None, tile_size=None, workers=None):
         """path -> path of the image to be sketched
 
         scale - > scaling factor for the sketched image,
@@ -697,168 +645,311 @@ class trace_from_image:
         
         blur -> always provide a odd number, the lower the value the more distortion, higher the value the more smooth, optimal value 51
 
-        skip_frequency -> used to speed the sketchpy the process by skipping some values
+        skip_frequency -> used to speed the sketchpy the process by skipping some values, ignored when simplify is given
+
+        renderer -> backend used to draw (turtle by default, use renderer.raster_renderer() to draw without a window)
+
+        cache -> True keeps the processed image in the shared cache so the same image is not processed again, or a cache.preprocess_cache object, None (default) or False disables it
+
+        simplify -> maximum distance in pixels between the contours and the simplified shapes drawn, higher values draw fewer points,
+        0 only removes duplicate and collinear points, None (default) keeps the skip_frequency thinning
+
+        tile_size -> process the image in horizontal tiles of this many rows on a pool of threads, which keeps the memory use low,
+        None tiles images larger than 4 megapixels, 0 processes the whole image at once
+
+        workers -> no of threads used for the tiles, the no of cpus by default
         """
+        import cv2
+
         self.path = path
         self.scale = scale
-        self.pen = tu.Turtle()
-        self.img = cv2.imread(path, 0)
-        self.x_off = int(-1 * (self.img.shape[1] // 2) * self.scale)
-        self.y_off = int((self.img.shape[0] // 2) * self.scale)
+        self.renderer = get_renderer(renderer)
+        self.src = cv2.imread(path, 0)
+        if self.src is None:
+            raise ValueError(f"could not read {path}")
+        self.x_off = int(-1 * (self.src.shape[1] // 2) * self.scale)
+        self.y_off = int((self.src.shape[0] // 2) * self.scale)
+        self.renderer.screensize(int(self.src.shape[1] * self.scale) + 20, int(self.src.shape[0] * self.scale) + 20)
         self.intensity = intensity
         self.save = save
-        self.window = tu.Screen()
         self.details = details
         self.blur = blur
         self.skip = skip_frequency
+        self.cache = cache
+        self.simplify = simplify
+        self.tile_size = tile_size
+        self.workers = workers
 
     def move_to(self, x, y):
-        self.pen.up()
-        self.pen.goto(x, y)
-        self.pen.down()
+        self.renderer.move_to(x, y)
+
+    def sketch_image(self):
+        """the preprocessing of the whole source image at once, returns (sketch image, thresholded sketch)"""
+        import cv2
+
+        _, binary_image = cv2.threshold(
+            self.src, self.intensity, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
+        )
+        kernel = np.ones((1, 1), np.uint8)
+        binary_image = cv2.morphologyEx(
+            binary_image, cv2.MORPH_OPEN, kernel, iterations=3
+        )
+        binary_image = cv2.morphologyEx(
+            binary_image, cv2.MORPH_CLOSE, kernel, iterations=3
+        )
+        num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(
+            binary_image
+        )
+        min_region_size = self.details
+
+        # lookup table of the labels to keep, label 0 is the background
+        keep = stats[:, cv2.CC_STAT_AREA] > min_region_size
+        keep[0] = False
+        output_image = np.zeros(
+            (self.src.shape[0], self.src.shape[1], 3), dtype=np.uint8
+        )
+        output_image[keep[labels]] = (255, 255, 255)
+
+        invert = cv2.bitwise_not(output_image)
+        blur = cv2.GaussianBlur(invert, (self.blur, self.blur), 0)
+        invertedblur = cv2.bitwise_not(blur)
+        img = cv2.divide(output_image, invertedblur, scale=256.0)
+
+        grey_img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        invert = cv2.bitwise_not(grey_img)
+        blur = cv2.GaussianBlur(invert, (self.blur, self.blur), 0)
+        invertedblur = cv2.bitwise_not(blur)
+        sketch = cv2.divide(grey_img, invertedblur, scale=256.0)
+        ret, thresh = cv2.threshold(sketch, self.intensity, 255, 0)
+        return img, thresh
 
     def processimage(self):
-        print("Processing the image ...")
-        try:
-            _, binary_image = cv2.threshold(
-                self.img, self.intensity, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
-            )
-            kernel = np.ones((1, 1), np.uint8)
-            binary_image = cv2.morphologyEx(
-                binary_image, cv2.MORPH_OPEN, kernel, iterations=3
+        """returns (sketch image, contours) of the source image, the sketch image gives the colors of the contours,
+        (None, None) when the processing failed"""
+        import cv2
+
+        tile_size = self.tile_size
+        if tile_size == None:
+            tile_size = TILE_SIZE if self.src.size > MIN_TILED_PIXELS else 0
+        cache = get_cache(self.cache)
+        if cache != None:
+            key = cache.key(
+                "trace_from_image", self.path, intensity=self.intensity, details=self.details, blur=self.blur, tile_size=tile_size
             )
-            binary_image = cv2.morphologyEx(
-                binary_image, cv2.MORPH_CLOSE, kernel, iterations=3
-            )
-            num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(
-                binary_image
-            )
-            output_image = np.zeros(
-                (self.img.shape[0], self.img.shape[1], 3), dtype=np.uint8
-            )
-            min_region_size = self.details
-
-            for label in range(1, num_labels):
-                region_size = stats[label, cv2.CC_STAT_AREA]
-                if region_size > min_region_size:
-                    region = np.where(labels == label, 255, 0).astype(np.uint8)
-                    output_image[np.where(labels == label)] = (255, 255, 255)
-
-            invert = cv2.bitwise_not(output_image)
-            blur = cv2.GaussianBlur(invert, (self.blur, self.blur), 0)
-            invertedblur = cv2.bitwise_not(blur)
-            sketch = cv2.divide(output_image, invertedblur, scale=256.0)
-
-            cv2.imwrite("ttmp.jpg", sketch)
-            self.img = cv2.imread("ttmp.jpg")
-
-            grey_img = cv2.cvtColor(self.img, cv2.COLOR_BGR2GRAY)
-            invert = cv2.bitwise_not(grey_img)
-            blur = cv2.GaussianBlur(invert, (self.blur, self.blur), 0)
-            invertedblur = cv2.bitwise_not(blur)
-            sketch = cv2.divide(grey_img, invertedblur, scale=256.0)
-            ret, thresh = cv2.threshold(sketch, self.intensity, 255, 0)
+            entry = cache.get(key)
+            if entry != None:
+                log("loaded the processed image from the cache")
+                with np.load(os.path.join(entry, "image.npz"), allow_pickle=False) as f:
+                    img = f["image"]
+                return img, load_contours(os.path.join(entry, "contours.npy"))
+
+        log("Processing the image ...")
+        try:
+            if tile_size:
+                log(f"processing the image in tiles of {tile_size} rows")
+                img, thresh = tiled_sketch(self.src, self.intensity, self.details, self.blur, tile_size, self.workers)
+            else:
+                img, thresh = self.sketch_image()
             ctu, hire = cv2.findContours(thresh, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)
 
-            return ctu
+            if cache != None:
+                def write(entry):
+                    # the channels of the sketch image are all the same grey, only one is kept, compressed
+                    grey = img if img.ndim == 2 else img[:, :, 0]
+                    np.savez_compressed(os.path.join(entry, "image.npz"), image=grey)
+                    save_contours(os.path.join(entry, "contours.npy"), ctu, *img.shape[:2])
+
+                cache.put(key, write)
+
+            return img, ctu
         except Exception as e:
-            print("error found!!!")
-            print(f"ERROR: {e}")
-            print(
-                """you can contact me on my youtube channel: https://www.youtube.com/c/codehub03 \\n discord : https://discord.gg/r2KFa73PM2 \\n instagram : https://www.instagram.com/mr.m_y_s_t_e_r_y/"""
+            log("error found!!!", level=ERROR)
+            log(f"ERROR: {e}", level=ERROR)
+            log(
+                """you can contact me on my youtube channel: https://www.youtube.com/c/codehub03 \\n discord : https://discord.gg/r2KFa73PM2 \\n instagram : https://www.instagram.com/mr.m_y_s_t_e_r_y/""",
+                level=ERROR,
             )
-
-    def draw(self):
-        ctu = self.processimage()
+            return None, None
+
+    def prepare(self):
+        """processes the image and returns the filled contours to draw as path_data, the points are in screen coordinates,
+        None when the image could not be processed"""
+        img, ctu = self.processimage()
+        if ctu is None:
+            return None
+        points = []
+        colors = []
         for n, pos in enumerate(ctu):
-            mask = np.zeros(self.img.shape[:2], dtype=np.uint8)
-            cv2.drawContours(mask, ctu, n, (255), thickness=cv2.FILLED)
-            average_color = cv2.mean(self.img, mask=mask)
+            te = pos.flatten()
+            if len(te) < self.details:
+                continue
+            average_color = contour_mean(img, pos)
             rgb = (
                 1 - average_color[0] / 255,
                 1 - average_color[1] / 255,
                 1 - average_color[2] / 255,
             )
-            te = pos.flatten()
-            if len(te) < self.details:
-                continue
-            x, y = (
-                int((te[0] * self.scale)) + self.x_off,
-                int(((te[1] * -1) * self.scale)) + self.y_off,
-            )
-            self.move_to(x, y)
-            self.pen.color(rgb)
-            self.pen.speed(0)
-            temp = (-999, -999)
-            self.pen.begin_fill()
-            for i in pos[1::self.skip]:
-                te = i.flatten()
-                x, y = (
-                    int((te[0] * self.scale)) + self.x_off,
-                    int(((te[1] * -1) * self.scale)) + self.y_off,
-                )
-                if temp != (x, y):
-                    self.pen.goto(x, y)
-                    temp = x, y
-            self.pen.end_fill()
-
-        print("done")
-        winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
+            pts = pos.reshape(-1, 2)
+            if self.simplify == None:
+                pts = np.concatenate([pts[:1], pts[1::self.skip]])
+            x = (pts[:, 0] * self.scale).astype(np.int32) + self.x_off
+            y = (pts[:, 1] * -1 * self.scale).astype(np.int32) + self.y_off
+            fill = np.stack([x, y], axis=1)
+            if self.simplify == None:
+                moved = np.concatenate([[True], (np.diff(fill, axis=0) != 0).any(axis=1)])
+                fill = fill[moved]
+            points.append(fill)
+            colors.append(rgb)
+
+        offsets = np.zeros(len(points) + 1, dtype=np.int64)
+        np.cumsum([len(p) for p in points], out=offsets[1:])
+        points = np.concatenate(points) if len(points) else np.zeros((0, 2), dtype=np.int32)
+        colors = np.array(colors, dtype=np.float32).reshape(-1, 3)
+        if self.simplify != None:
+            points, offsets, _ = simplify_paths(points, offsets, self.simplify, stage="simplified the contours")
+        return path_data(points, offsets, colors, img.shape[0], img.shape[1], self.scale, offsets[:-1])
+
+    def draw(self, update_every=None, reorder=False):
+        """update_every -> None animates every shape, n refreshes the screen once every n shapes, "instant" refreshes once at the end\n
+        reorder -> draw the shapes in the order that shortens the pen travel, shapes of different colors that overlap keep their order"""
+        data = self.prepare()
+        if data is None:
+            return 0
+        if reorder:
+            points, offsets, order = reorder_paths(data.points, data.offsets, data.colors)
+            data = path_data(points, offsets, data.colors[order], data.height, data.width, data.scale, offsets[:-1])
+        frames = frame_counter(self.renderer, update_every)
+        for n in range(len(data)):
+            self.renderer.color(tuple(data.colors[n].tolist()))
+            self.renderer.polygon(data.path(n).tolist())
+            frames.tick()
+        frames.finish()
+
+        log("done")
+        play_sound()
         if self.save:
-            image = ImageGrab.grab()
-            image.save("sketch.png")
-            print("your sketch is saved as sketch.png!!")
-        tu.done()
-
-
+            self.renderer.save("sketch.png")
+            log("your sketch is saved as sketch.png!!")
+        self.renderer.done()
+
+
+
+
+def char_runs(lines, color_set, skip=()):
+    """finds the runs of consecutive characters with the same color on every line of an ascii art\n
+    lines -> list of strings, one per line\n
+    color_set -> dictionary map for specific character to a specific color\n
+    skip -> colors that are left out, like the background color\n
+    returns a dict of color -> (rows, starts, ends) arrays, run n covers the characters starts[n] to ends[n] - 1 of line rows[n]"""
+    lines = [line.rstrip("\n") for line in lines]
+    width = max([len(line) for line in lines] + [0])
+    codes = np.zeros((len(lines), width + 2), dtype=np.int64)
+    valid = np.zeros((len(lines), width + 2), dtype=bool)
+    for n, line in enumerate(lines):
+        codes[n, 1 : len(line) + 1] = np.frombuffer(line.encode("utf-32-le"), dtype=np.uint32)
+        valid[n, 1 : len(line) + 1] = True
+
+    names = list(dict.fromkeys(color_set.values()))
+    lut = np.full(max([int(codes.max())] + [ord(c) for c in color_set]) + 1, -1)
+    for c, col in color_set.items():
+        lut[ord(c)] = names.index(col)
+    ids = np.where(valid, lut[codes], -1)
+    unknown = valid & (ids == -1)
+    if unknown.any():
+        raise KeyError(chr(codes[unknown][0]))
+
+    # a run starts wherever the color differs from the previous character, and lasts until the next start
+    rows, cols = np.nonzero(ids[:, 1:] != ids[:, :-1])
+    same_row = rows[:-1] == rows[1:]
+    rows, starts, ends = rows[:-1][same_row], cols[:-1][same_row], cols[1:][same_row]
+    run_ids = ids[rows, starts + 1]
+
+    res = {}
+    for n, name in enumerate(names):
+        keep = run_ids == n
+        if name in skip or not keep.any():
+            continue
+        res[name] = (rows[keep], starts[keep], ends[keep])
+    return res
+
+
+def run_cells(rows, starts, ends):
+    """the (rows, cols) of every character covered by the runs found by char_runs"""
+    lengths = ends - starts
+    first = np.cumsum(lengths) - lengths
+    cols = np.arange(int(lengths.sum())) - np.repeat(first - starts, lengths)
+    return np.repeat(rows, lengths), cols
+
+
+def dark_runs(bw_img, row_stride=1, min_run=1):
+    """finds the horizontal runs of dark (0) pixels of a thresholded image\n
+    row_stride -> only every row_stride-th row is scanned\n
+    min_run -> runs shorter than this many pixels are dropped\n
+    returns (rows, starts, ends) arrays, run n covers the pixels starts[n] to ends[n] - 1 of row rows[n]"""
+    dark = bw_img[::row_stride] == 0
+    padded = np.zeros((dark.shape[0], dark.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = dark
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    keep = (ends - starts) >= min_run
+    return rows[keep] * row_stride, starts[keep], ends[keep]
 
 
 class sketch_from_image:
-    def __init__(self, path, save=True) -> None:
+    def __init__(self, path, save=True, renderer=None) -> None:
         """used to trace the image line by line,
         path -> path of the image
         save -> used to same the results
+        renderer -> backend used to draw (turtle by default, use renderer.raster_renderer() to draw without a window)
         reffer my youtube channel to know more about it,"""
         self.path = path
         self.save = save
-        self.window = tu.Screen()
+        self.renderer = get_renderer(renderer)
 
-    def draw(self, threshold=127):
+    def prepare(self, threshold=127, row_stride=1, min_run=1):
+        """returns the runs of dark pixels as path_data, every run is a two point path in screen coordinates"""
+        import cv2
 
         img = cv2.imread(self.path, 2)
+        if img is None:
+            raise ValueError(f"could not read {self.path}")
         ret, bw_img = cv2.threshold(img, threshold, 255, cv2.THRESH_BINARY)
-        width = int(img.shape[1])
-        height = int(img.shape[0])
-        print(f"image loaded from {self.path}")
-        my_screen = tu.Screen()
-        my_screen.screensize(width, height)
-        my_pen = tu.Turtle()
-        my_screen.tracer(0)
-
-        for i in tqdm(range(int(height / 2), int(height / -2), -1)):
-            my_pen.penup()
-            my_pen.goto(-(width / 2), i)
-
-            for l in range(-int(width / 2), int(width / 2), 1):
-                pix_width = int(l + (width / 2))
-                pix_height = int(height / 2 - i)
-                # print(f'height = {pix_height} ,width = {pix_width}, val = {bw_img[pix_height,pix_height]}')
-                if bw_img[pix_height, pix_width] == 0:
-                    my_pen.pendown()
-                    my_pen.forward(1)
-                else:
-                    my_pen.penup()
-                    my_pen.forward(1)
-            my_screen.update()
+        height, width = img.shape[:2]
+        rows, starts, ends = dark_runs(bw_img, row_stride, min_run)
+        y = int(height / 2) - rows
+        points = np.stack([starts, y, ends, y], axis=1).reshape(-1, 2) - [int(width / 2), 0]
+        offsets = np.arange(len(rows) + 1, dtype=np.int64) * 2
+        colors = np.zeros((len(rows), 3), dtype=np.float32)
+        return path_data(points.astype(np.int32), offsets, colors, height, width, 1, offsets[:-1])
+
+    def draw(self, threshold=127, row_stride=1, min_run=1, update_every=None):
+        """threshold -> pixels darker than this are drawn
+        row_stride -> draw every row_stride-th row with a thicker pen, higher values are faster but coarser
+        min_run -> skip runs of dark pixels shorter than this many pixels
+        update_every -> None refreshes the screen once every row, n once every n rows, "instant" refreshes once at the end"""
+        data = self.prepare(threshold, row_stride, min_run)
+        log(f"image loaded from {self.path}")
+        self.renderer.screensize(data.width, data.height)
+        frames = frame_counter(self.renderer, 1 if update_every == None else update_every)
+        self.renderer.width(row_stride)
+
+        # every run is a two point path, the runs are sorted by row, so the runs of a row are consecutive paths
+        segments = data.points.reshape(-1, 2, 2).tolist()
+        first = np.append(np.flatnonzero(np.diff(data.points[::2, 1], prepend=np.inf)), len(segments))
+
+        for n in track(range(len(first) - 1), stage="sketching"):
+            self.renderer.lines(segments[first[n] : first[n + 1]])
+            frames.tick()
+        frames.finish()
         if self.save:
-            image = ImageGrab.grab()
-            image.save("sketch.png")
-            print("your sketch is saved as sketch.png!!")
+            self.renderer.save("sketch.png")
+            log("your sketch is saved as sketch.png!!")
 
-        my_pen.hideturtle()
-        winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
-        print("done!")
-        tu.done()
+        self.renderer.hide()
+        play_sound()
+        log("done!")
+        self.renderer.done()
 
 
 
@@ -870,14 +961,22 @@ class ai_sketch_from_image:
                     scale=500,
                     x_offset=0,
                     y_offset=0,
-                    save=True):
+                    save=True,
+                    renderer=None,
+                    tolerance=0.5,
+                    cache=None,
+                    models=None):
         """img_path -> path of the svg file\n
         style_index -> [0-3] each index produces different syles of images\n
-        no_of_processes -> on of simultanious threads to process the SVG file faster(set it to the no of cores in the system, default value: 4)\n
+        no_of_processes -> no of worker processes used to process the SVG file faster (set it to the no of cores in the system, 1 processes it without any worker, default value: 1)\n
         scale -> zoom value\n
         x_offset -> amount of movemnt in x direction\n
         y_offset -> amount of movemnt in y direction\n
         save -> True = take a screenshot and save it\n
+        renderer -> backend used to draw (turtle by default, use renderer.raster_renderer() to draw without a window)\n
+        tolerance -> maximum distance in pixels between the svg curves and the sampled points, lower values sample more points\n
+        cache -> True keeps the converted image and the sampled paths in the shared cache, or a cache.preprocess_cache object, None (default) or False disables it\n
+        models -> model_manager that keeps the AnimeGAN models loaded between images (see sketchpy.models), the shared one by default\n
 
         used to sketch an colored cartoon image from a image file,  reffer my youtube channel to know more about it
         """
@@ -888,77 +987,64 @@ class ai_sketch_from_image:
         self.scale = scale
         self.save = save
         self.no_of_processes =  no_of_processes
+        self.renderer = renderer
+        self.tolerance = tolerance
+        self.cache = cache
+        self.models = models
 
         self.height = 0
         self.width = 0
     
     def convert_image(self):
-        varients =  ['face_paint_512_v1', 'face_paint_512_v2', 'celeba_distill', 'paprika']
-        model = torch.hub.load("bryandlee/animegan2-pytorch:main", "generator", pretrained=varients[self.style_index])
-        face2paint = torch.hub.load("bryandlee/animegan2-pytorch:main", "face2paint", size=512)
+        from .models import get_models
+
+        models = get_models(self.models)
+        cache = get_cache(self.cache)
+        if cache != None:
+            # the inference modes give slightly different outputs, so they are cached separately
+            key = cache.key("ai_sketch_from_image.convert_image", self.path, style_index=self.style_index, mode=models.mode, size=models.size)
+            entry = cache.get(key)
+            if entry != None:
+                log("loaded the converted image from the cache")
+                shutil.copyfile(os.path.join(entry, "source.jpg"), "source.jpg")
+                return
+
+        from PIL import Image
+
         img = Image.open(self.path).convert("RGB")
-        out = face2paint(model, img)
+        out = models.cartoonize([img], self.style_index)[0]
         out.save("source.jpg")
+        if cache != None:
+            cache.put(key, lambda entry: shutil.copyfile("source.jpg", os.path.join(entry, "source.jpg")))
 
     def hex_to_rgb(self, string):
-            strlen = len(string)
-            # print(string)
-            if string.startswith("#"):
-                if strlen == 7:
-                    r = string[1:3]
-                    g = string[3:5]
-                    b = string[5:7]
-                elif strlen == 4:
-                    r = string[1:2] * 2
-                    g = string[2:3] * 2
-                    b = string[3:4] * 2
-            elif strlen == 3:
-                r = string[0:1] * 2
-                g = string[1:2] * 2
-                b = string[2:3] * 2
-            else:
-                r = string[0:2]
-                g = string[2:4]
-                b = string[4:6]
-
-            return int(r, 16) / 255, int(g, 16) / 255, int(b, 16) / 255
-
-    def process(self,data, id, queue):
-        try:
-            for i in tqdm(data):
-                path = parse_path(i["d"])
-                co = i["fill"]
-                # co = i["style"].replace("fill: ", "").replace(";", "")
-                col = self.hex_to_rgb(co)
-                transform = i["transform"].replace("translate(", "").replace(")", "")
-                transform = list(map(float, transform.split(",")))
-                transform = list(map(int, transform))
-                n = str(path).split(" ")
-                n = len(n) // 5 - 10
-                if n <= 20:
-                    n = 20
-                pts = [
-                    (
-                        (int(((p.real + transform[0] - self.x_offset ) / self.width) * self.scale))
-                        ,
-                        (int(((p.imag + transform[1] - self.y_offset) / self.height) * self.scale))
-                        ,
-                    )
-                    for p in (path.point(i / n) for i in range(1, n + 1))
-                ]
+        return hex_to_rgb(string)
 
-                queue.put((pts, col))
-        except Exception as e:
-            print(f"Error : {e}")  
+    def cached_svg(self, entry, file_name=None):
+        self.res = load_paths(os.path.join(entry, "paths.npy"))
+        self.height, self.width = self.res.height, self.res.width
+        log("loaded the svg data from the cache")
+        if file_name != None:
+            self.res.save(file_name + ".npy")
+        return self.res
 
-    def load_svg(self, file_name=os.path.abspath(sys.argv[0]).replace(".py", "")):
-        """file_name -> name of the npy array, you can use this array data to sketch images directly"""
+    def load_svg(self, file_name=None):
+        """file_name -> name of the npy file to save the data to, you can use this file to sketch images directly with draw(file=...)\n
+        returns the sampled paths as a path_data object, they are also kept in the cache so loading the same svg again is instant"""
         h=""
         w=""
+        cache = get_cache(self.cache)
+        if cache != None and self.path != None:
+            key = cache.key("ai_sketch_from_image", "out.svg", scale=self.scale, tolerance=self.tolerance, x_offset=self.x_offset, y_offset=self.y_offset)
+            entry = cache.get(key)
+            if entry != None:
+                return self.cached_svg(entry, file_name)
         if self.path != None:
+            from svgpathtools import svg2paths2
+
             paths, attributes, svg_att = svg2paths2('out.svg')
             self.attr = attributes
-        print("loding svg data...")
+        log("loding svg data...")
         try:
             try:
                 h = svg_att["height"]
@@ -992,59 +1078,40 @@ class ai_sketch_from_image:
             if self.y_offset == 0:
                 self.y_offset = (self.width) // 2
           
-            self.res = []
             try:
-                self.res.append([self.height, self.width, self.scale])
-                def divide_list(lst, n):
-                    division = len(lst) / n
-                    return [lst[int(round(division * i)): int(round(division * (i + 1)))] for i in range(n)]
-
-
-                div_list = divide_list(attributes, self.no_of_processes)
-                processes = []
-                queue = mp.Queue()
-                for num, i in enumerate(div_list):
-                    p = mp.Process(target= self.process, args= ( i, num, queue ))
-                    p.start()
-
-                    processes.append(p)
-
-                while True:
-                    if not any(p.is_alive() for p in processes) and queue.empty():
-                        break  # If all processes finished and queue is empty, break the loop
-                    while not queue.empty():
-                        data_received = queue.get() 
-                        self.res.append(data_received)
-
-                    
-                for p in processes:
-                    p.join()
-
-                # temp = [self.res]
-
-                # for num in range(self.no_of_processes):
-                #     temp.append(np.load(f"{num}.npy", allow_pickle=True))
-                # self.res = np.concatenate(temp, axis=0)
-                np_array = np.array(self.res,  dtype=object)
-                np.save(file_name+".npy", np_array, allow_pickle=True)
+                with progress_bar(len(attributes), "sampling paths") as bar:
+                    self.points, self.offsets, self.colors, self.breaks = sample_svg(
+                        attributes,
+                        self.width,
+                        self.height,
+                        self.scale,
+                        self.tolerance,
+                        pre_offset=(self.x_offset, self.y_offset),
+                        workers=self.no_of_processes,
+                        progress=bar.update,
+                    )
+                self.res = path_data(self.points, self.offsets, self.colors, self.height, self.width, self.scale, self.breaks)
+                if file_name != None:
+                    self.res.save(file_name + ".npy")
+                if cache != None:
+                    cache.put(key, lambda entry: self.res.save(os.path.join(entry, "paths.npy")))
                 return self.res
 
             except Exception as e:
-                print(e)
-                print(f"Error : {e}")
-                print("youtube : https://www.youtube.com/c/CODEHUB03")
+                log(e, level=ERROR)
+                log(f"Error : {e}", level=ERROR)
+                log("youtube : https://www.youtube.com/c/CODEHUB03", level=ERROR)
                 return None
         except Exception as e:
-            print("error found!!!")
-            print(f"ERROR: {e}")
-            print(
-                """you can contact me on my youtube channel: https://www.youtube.com/c/codehub03 \\n discord : https://discord.gg/r2KFa73PM2 \\n instagram : https://www.instagram.com/mr.m_y_s_t_e_r_y/"""
+            log("error found!!!", level=ERROR)
+            log(f"ERROR: {e}", level=ERROR)
+            log(
+                """you can contact me on my youtube channel: https://www.youtube.com/c/codehub03 \\n discord : https://discord.gg/r2KFa73PM2 \\n instagram : https://www.instagram.com/mr.m_y_s_t_e_r_y/""",
+                level=ERROR,
             )
 
     def move_to(self, x, y):
-        self.pen.up()
-        self.pen.goto(x, y)
-        self.pen.down()
+        self.renderer.move_to(x, y)
 
     def draw(
         self,
@@ -1054,94 +1121,81 @@ class ai_sketch_from_image:
         x_offset=0,
         y_offset=0,
         scale=None,
-        speed=1,
+        speed=None,
+        allow_pickle=False,
+        update_every=None,
     ):
         """
         retain -> retain the window after sketching\n
         file -> file path of the npy file for direct sketching\n
-        data -> raw data,  should be a list in [[[x1,y1], [x2,y2], ....], [255,255,255]], first nested list is the points and the second list the color\n
+        data -> raw data,  should be a list in [[[x1,y1], [x2,y2], ....], [255,255,255]], first nested list is the points and the second list the color, or a path_data object returned by load_svg\n
         x_offset -> amount of movement in x direction while sketching\n
         y_offset -> amount of movement in y direction while sketching\n
         scale -> zoom value while sketching\n
-        speed -> speed of sketching"""
-
+        speed -> no longer used, use update_every instead\n
+        allow_pickle -> allow loading npy files saved by older versions of sketchpy, only use it for files you trust\n
+        update_every -> None refreshes the screen once every path, n once every n paths, "instant" refreshes once at the end"""
         if self.path != None:
             self.convert_image()
+            import pkg_resources
+
             exe_path = pkg_resources.resource_filename('sketchpy', 'files/trace.exe')
             try:
                 subprocess.run([exe_path,"source.jpg"], shell=True)
             except Exception as e:
-                print("An error occurred:", e)
+                log("An error occurred:", e, level=ERROR)
 
         if file != None:
-            coordinates = np.load(file, allow_pickle=True)
-            print(f"datas are loaded from {file}")
-        elif data != None:
+            coordinates = read_paths(file, allow_pickle)
+            log(f"datas are loaded from {file}")
+        elif data is not None:
             coordinates = data
         else:
             coordinates = self.load_svg()
-            if coordinates == None:
+            if coordinates is None:
                 return 0
-        wn = tu.Screen()
-        wn.tracer(0)
-        self.pen = tu.Turtle()
-        self.pen.speed(0)
-        self.screen = tu.Screen()
-        dimension = coordinates[0]
+        self.renderer = get_renderer(self.renderer)
+        if speed != None:
+            log("speed is no longer used, use update_every to control how often the screen is refreshed")
+            if update_every == None:
+                update_every = speed
+        frames = frame_counter(self.renderer, 1 if update_every == None else update_every)
+        dimension, paths = split_paths(coordinates)
         height = dimension[0]
         width = dimension[1]
 
         if scale == None:
-            try:
-                scale = dimension[2]
-
-            except:
+            scale = dimension[2]
+            if scale == None:
                 scale = self.scale
 
         else:
-            print(f"scaling the image by the factor of :{scale}")
-
-        for n_path, path_col in enumerate(tqdm(coordinates[1:])):
-            f = 1
-            self.pen.color("black")
-            path = path_col[0]
-            col = path_col[1]
-            self.pen.color(col)
-            self.pen.begin_fill()
-
-            for num, coord in enumerate(path):
-                x, y = coord
-                x, y = (int((x * scale) / height)) - x_offset, (
-                    int((y * scale) / width)
-                ) - y_offset
-                y *= -1
-                if f:
-                    self.pen.end_fill()
-                    self.move_to(x, y)
-                    self.pen.begin_fill()
-
-                    f = 0
-
-                elif coord in path[num + 1 :]:
-                    self.pen.end_fill()
-                    self.move_to(x, y)
-                    self.pen.begin_fill()
+            log(f"scaling the image by the factor of :{scale}")
 
-                else:
-                    self.pen.goto(x, y)
-            self.pen.end_fill()
-            if n_path % speed == 0:
-                wn.update()
+        fit_renderer(
+            self.renderer,
+            (paths.points[:, 0] * scale / height).astype(int) - x_offset,
+            (paths.points[:, 1] * scale / width).astype(int) - y_offset,
+        )
+
+        for n_path in track(range(len(paths)), stage="sketching"):
+            self.renderer.color(tuple(paths.colors[n_path].tolist()))
+
+            for sub in paths.subpaths(n_path):
+                x = (sub[:, 0] * scale / height).astype(int) - x_offset
+                y = (sub[:, 1] * scale / width).astype(int) - y_offset
+                self.renderer.polygon(list(zip(x.tolist(), (-y).tolist())))
+            frames.tick()
+        frames.finish()
 
         if self.save:
-            image = ImageGrab.grab()
-            image.save("sketch.png")
-            print("your sketch is saved as sketch.png!!")
+            self.renderer.save("sketch.png")
+            log("your sketch is saved as sketch.png!!")
 
         if retain == True:
-            print("done sketching")
-            winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
-            tu.done()
+            log("done sketching")
+            play_sound()
+            self.renderer.done()
 
 
 
@@ -0,0 +1,87 @@
+import os
+
+import numpy as np
+
+from .pathcache import path_data, save_paths, load_paths
+
+
+BLOCK_SIZE = 1 << 20
+_separators = str.maketrans("(),", "   ")
+
+
+def _parse_block(text):
+    values = np.array(text.translate(_separators).split(), dtype=np.int32)
+    if len(values) % 2:
+        raise ValueError("the coordinate file has a line without a y value")
+    return values.reshape(-1, 2)
+
+
+def parse_coords(stream, block_size=BLOCK_SIZE):
+    """parses the (x, y) lines written by trace.trace from an open text stream, block by block, so only
+    one block of text is held in memory at a time\n
+    returns a (n, 2) int32 array, the (-1, -1) break points are kept"""
+    chunks = []
+    rest = ""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        block = rest + block
+        end = block.rfind("\n") + 1
+        rest = block[end:]
+        if end:
+            chunks.append(_parse_block(block[:end]))
+    if rest.strip():
+        chunks.append(_parse_block(rest))
+    if len(chunks) == 0:
+        return np.zeros((0, 2), dtype=np.int32)
+    return np.concatenate(chunks)
+
+
+def read_coords(file_name, block_size=BLOCK_SIZE):
+    """parses a coordinate .txt file, see parse_coords"""
+    with open(file_name, "r") as f:
+        return parse_coords(f, block_size)
+
+
+def split_markers(coord):
+    """turns coordinates where (-1, -1) starts a new stroke into (points, offsets),
+    points is a (n, 2) int32 array without the markers and stroke i is points[offsets[i]:offsets[i + 1]]"""
+    coord = np.asarray(coord, dtype=np.int32).reshape(-1, 2)
+    marker = (coord[:, 0] == -1) & (coord[:, 1] == -1)
+    n_before = np.cumsum(marker) - marker
+    # index of the first point of every stroke once the markers are removed
+    starts = np.flatnonzero(np.r_[True, marker[:-1]] & ~marker)
+    offsets = np.r_[starts - n_before[starts], (~marker).sum()].astype(np.int64)
+    return coord[~marker], offsets
+
+
+def save_binary(file_name, coord, height=0, width=0):
+    """writes the coordinates in the path file format (see pathcache), every stroke is one path,
+    height and width are the size of the traced image"""
+    points, offsets = split_markers(coord)
+    colors = np.zeros((len(offsets) - 1, 3), dtype=np.float32)
+    save_paths(file_name, path_data(points, offsets, colors, height, width, 1, offsets[:-1]))
+
+
+def write_companion(file, height=0, width=0):
+    """parses file.txt and writes its binary companion file.npy next to it"""
+    save_binary(f"{file}.npy", read_coords(f"{file}.txt"), height, width)
+
+
+def load_strokes(file):
+    """returns the strokes of a traced file as (points, offsets), file is the name without the extension\n
+    file.npy is memory mapped when it is at least as new as file.txt, otherwise file.txt is parsed"""
+    txt, npy = f"{file}.txt", f"{file}.npy"
+    if os.path.exists(npy) and (not os.path.exists(txt) or os.path.getmtime(npy) >= os.path.getmtime(txt)):
+        try:
+            data = load_paths(npy)
+            return data.points, data.offsets
+        except ValueError:
+            pass
+    return split_markers(read_coords(txt))
+
+
+def strokes(points, offsets):
+    """list of the (n, 2) arrays of every stroke"""
+    return [points[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
@@ -0,0 +1,97 @@
+import numpy as np
+
+
+FONTS = (
+    "DejaVuSansMono.ttf",
+    "LiberationMono-Regular.ttf",
+    "cour.ttf",
+    "Courier New.ttf",
+    "Menlo.ttc",
+)
+
+_atlases = {}
+
+
+def load_font(size, font=None):
+    """loads a truetype font with PIL\n
+    size -> font size in pixels\n
+    font -> path or name of the font, the first monospace font of FONTS found on the system by default"""
+    from PIL import ImageFont
+
+    if font != None:
+        return ImageFont.truetype(font, size)
+    for name in FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # older versions of PIL only have a fixed size bitmap font
+        return ImageFont.load_default()
+
+
+class glyph_atlas:
+    def __init__(self, chars, font_size=16, font=None, cell=None):
+        """the characters of a charset rasterized once into coverage masks, used to draw text into a numpy image\n
+        chars -> string of the characters that can be drawn\n
+        font_size -> size of the font in pixels\n
+        font -> path or name of a truetype font, a monospace font of the system by default\n
+        cell -> (width, height) of a character cell, 0.6 and 1.2 times the font size by default"""
+        from PIL import Image, ImageDraw
+
+        self.chars = "".join(dict.fromkeys(chars))
+        if cell == None:
+            cell = (int(font_size * 0.6), int(font_size * 1.2))
+        self.width, self.height = cell
+
+        pil_font = load_font(font_size, font)
+        self.masks = np.zeros((len(self.chars), self.height, self.width), dtype=np.float32)
+        for n, c in enumerate(self.chars):
+            img = Image.new("L", cell, 0)
+            ImageDraw.Draw(img).text((0, 0), c, fill=255, font=pil_font)
+            self.masks[n] = np.asarray(img, dtype=np.float32) / 255
+
+        codes = np.array([ord(c) for c in self.chars], dtype=np.int64)
+        self.lut = np.full(codes.max() + 1 if len(codes) else 1, -1, dtype=np.intp)
+        self.lut[codes] = np.arange(len(codes))
+
+    def index(self, chars):
+        """maps an array of single characters to the index of their mask"""
+        codes = np.asarray(chars, dtype="<U1").view(np.uint32).astype(np.int64)
+        ids = np.where(codes < len(self.lut), self.lut[np.minimum(codes, len(self.lut) - 1)], -1)
+        if (ids == -1).any():
+            raise KeyError(chr(codes[ids == -1][0]))
+        return ids
+
+    def render(self, chars, colors, background=(255, 255, 255), margin=0):
+        """draws every character in its own color into an rgb image\n
+        chars -> (rows, cols) array of single characters\n
+        colors -> (rows, cols, 3) array of the rgb colors in the 0-255 range\n
+        background -> rgb color of the background\n
+        margin -> empty pixels around the text\n
+        returns a (rows * cell height + 2 * margin, cols * cell width + 2 * margin, 3) uint8 array"""
+        ids = self.index(chars)
+        rows, cols = ids.shape
+        h, w = self.height, self.width
+        bg = np.asarray(background, dtype=np.float32)
+        colors = np.asarray(colors, dtype=np.float32)
+
+        img = np.empty((rows * h + 2 * margin, cols * w + 2 * margin, 3), dtype=np.uint8)
+        img[:] = np.asarray(background, dtype=np.uint8)
+        # one line of text at a time, so the float buffers stay the size of a single line
+        for r in range(rows):
+            alpha = self.masks[ids[r]].transpose(1, 0, 2).reshape(h, cols * w, 1)
+            line = np.repeat(colors[r], w, axis=0)
+            y = margin + r * h
+            img[y : y + h, margin : margin + cols * w] = (bg + (line - bg) * alpha + 0.5).astype(np.uint8)
+        return img
+
+
+def get_atlas(chars, font_size=16, font=None, cell=None):
+    """returns the glyph_atlas of the charset, it is only rasterized the first time and shared afterwards"""
+    key = ("".join(dict.fromkeys(chars)), font_size, font, cell)
+    if key not in _atlases:
+        _atlases[key] = glyph_atlas(*key)
+    return _atlases[key]
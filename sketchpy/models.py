@@ -0,0 +1,208 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from .reporting import log
+
+
+STYLES = ["face_paint_512_v1", "face_paint_512_v2", "celeba_distill", "paprika"]
+REPO = "bryandlee/animegan2-pytorch:main"
+WEIGHTS_URL = "https://github.com/bryandlee/animegan2-pytorch/raw/main/weights/{}.pt"
+MODES = ("eager", "channels_last", "torchscript", "onnx")
+
+
+class model_manager:
+    def __init__(self, weights_dir=None, max_models=2, threads=None, size=512, mode="eager"):
+        """keeps the AnimeGAN generators used by ai_sketch_from_image loaded, so the hub lookup, the import
+        and the weights are only loaded once per process\n
+        weights_dir -> folder holding the <style>.pt weights, the missing ones are downloaded into it the first
+        time they are used, defaults to $SKETCHPY_MODEL_DIR or ~/.cache/sketchpy/models\n
+        max_models -> no of styles kept in memory, the least recently used one is dropped\n
+        threads -> no of threads torch uses for inference, None keeps the default of torch\n
+        size -> the images are cropped to a square and resized to size x size pixels before the conversion\n
+        mode -> how the generator runs on the cpu, the converted models are kept in weights_dir/converted:
+        "eager" runs the float32 pytorch model as it is,
+        "channels_last" runs it with the channels last memory layout,
+        "torchscript" traces and freezes the channels last model,
+        "onnx" exports the model to onnx and runs it with onnxruntime, which has to be installed\n
+        there is no int8 mode, the generator normalizes with GroupNorm after every convolution, so a quantized
+        model converts back to float around every one of them and runs slower than the float32 model"""
+        if mode not in MODES:
+            raise ValueError(f"mode should be one of {MODES}")
+        if weights_dir == None:
+            weights_dir = os.environ.get(
+                "SKETCHPY_MODEL_DIR",
+                os.path.join(os.path.expanduser("~"), ".cache", "sketchpy", "models"),
+            )
+        self.weights_dir = weights_dir
+        self.max_models = max_models
+        self.threads = threads
+        self.size = size
+        self.mode = mode
+        self.models = OrderedDict()
+        self.generator = None
+
+    def weights(self, style_index):
+        """path of the weights of the style, downloaded when they are not in weights_dir yet"""
+        import torch
+
+        name = STYLES[style_index]
+        path = os.path.join(self.weights_dir, name + ".pt")
+        if not os.path.exists(path):
+            log(f"downloading the {name} weights to {self.weights_dir}")
+            os.makedirs(self.weights_dir, exist_ok=True)
+            torch.hub.download_url_to_file(WEIGHTS_URL.format(name), path + ".part")
+            os.replace(path + ".part", path)
+        return path
+
+    def load(self, style_index):
+        import warnings
+        import torch
+
+        warnings.filterwarnings("ignore", message="TypedStorage is deprecated")
+        weights = self.weights(style_index)
+        if self.generator == None:
+            # the generator class comes from the hub repo, it is only imported for the first model,
+            # from the local copy of the repo when torch already downloaded it
+            repo_dir = os.path.join(torch.hub.get_dir(), REPO.replace("/", "_").replace(":", "_"))
+            # the hub entry point treats a string as an url, the local weights are loaded below instead
+            if os.path.isdir(repo_dir):
+                model = torch.hub.load(repo_dir, "generator", source="local", pretrained=False)
+            else:
+                model = torch.hub.load(REPO, "generator", pretrained=False)
+            self.generator = type(model)
+        else:
+            model = self.generator()
+        model.load_state_dict(torch.load(weights, map_location="cpu"))
+        return model.eval()
+
+    def converted(self, style_index, ext):
+        """path of the converted model of the style in the current mode, it depends on the torch version and the size"""
+        import torch
+
+        name = f"{STYLES[style_index]}-{self.mode}-{self.size}-torch{torch.__version__}.{ext}"
+        return os.path.join(self.weights_dir, "converted", name)
+
+    def save_converted(self, path, save):
+        """save(file_name) writes the converted model, it only shows up at path once it is complete"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        save(path + ".part")
+        os.replace(path + ".part", path)
+
+    def compile(self, style_index, example):
+        """returns fn(batch) -> output running the generator of the style in the mode of the manager, both
+        float32 numpy arrays of shape (n, 3, size, size)\n
+        example -> a batch of inputs, used to trace the model"""
+        import torch
+
+        if self.mode == "onnx":
+            return self.compile_onnx(style_index, example)
+
+        path = self.converted(style_index, "pt")
+        if self.mode == "torchscript" and os.path.exists(path):
+            model = torch.jit.load(path, map_location="cpu")
+        else:
+            model = self.load(style_index)
+            if self.mode != "eager":
+                model = model.to(memory_format=torch.channels_last)
+            if self.mode == "torchscript":
+                inputs = torch.from_numpy(example[:1]).contiguous(memory_format=torch.channels_last)
+                with torch.no_grad():
+                    model = torch.jit.freeze(torch.jit.trace(model, inputs).eval())
+                self.save_converted(path, lambda file_name: torch.jit.save(model, file_name))
+                log(f"saved the {self.mode} model to {path}")
+
+        memory_format = torch.contiguous_format if self.mode == "eager" else torch.channels_last
+
+        def run(batch):
+            with torch.inference_mode():
+                out = model(torch.from_numpy(batch).contiguous(memory_format=memory_format))
+                return out.contiguous().numpy()
+
+        return run
+
+    def compile_onnx(self, style_index, example):
+        try:
+            import onnxruntime
+        except ImportError:
+            raise ImportError('the "onnx" mode needs onnxruntime, install it with pip install onnxruntime')
+
+        path = self.converted(style_index, "onnx")
+        if not os.path.exists(path):
+            import torch
+
+            model = self.load(style_index)
+            self.save_converted(
+                path,
+                lambda file_name: torch.onnx.export(
+                    model,
+                    torch.from_numpy(example[:1]),
+                    file_name,
+                    input_names=["input"],
+                    output_names=["output"],
+                    dynamic_axes={"input": {0: "batch"}, "output": {0: "batch"}},
+                ),
+            )
+            log(f"saved the onnx model to {path}")
+
+        options = onnxruntime.SessionOptions()
+        if self.threads != None:
+            options.intra_op_num_threads = self.threads
+        session = onnxruntime.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        return lambda batch: session.run(None, {"input": batch})[0]
+
+    def get(self, style_index, example):
+        """the generator of the style as fn(batch) -> output, compiled on first use and kept in the lru"""
+        if style_index in self.models:
+            self.models.move_to_end(style_index)
+            return self.models[style_index]
+        model = self.compile(style_index, example)
+        self.models[style_index] = model
+        while len(self.models) > self.max_models:
+            self.models.popitem(last=False)
+        return model
+
+    def to_input(self, img):
+        """crops the PIL image to its centered square and maps it to a (3, size, size) array in the -1 to 1 range"""
+        from PIL import Image
+
+        w, h = img.size
+        s = min(w, h)
+        img = img.convert("RGB").crop(((w - s) // 2, (h - s) // 2, (w + s) // 2, (h + s) // 2))
+        img = img.resize((self.size, self.size), Image.LANCZOS)
+        return np.asarray(img, dtype=np.float32).transpose(2, 0, 1) / 255 * 2 - 1
+
+    def to_image(self, out):
+        """maps a (3, size, size) output of the generator back to a PIL image"""
+        from PIL import Image
+
+        out = (np.clip(out * 0.5 + 0.5, 0, 1) * 255).astype(np.uint8)
+        return Image.fromarray(out.transpose(1, 2, 0))
+
+    def cartoonize(self, images, style_index=3, batch_size=4):
+        """runs the generator of the style on a list of PIL images, batch_size images at a time\n
+        returns the list of converted PIL images"""
+        import torch
+
+        if self.threads != None:
+            torch.set_num_threads(self.threads)
+        res = []
+        for n in range(0, len(images), batch_size):
+            batch = np.stack([self.to_input(img) for img in images[n : n + batch_size]])
+            out = self.get(style_index, batch)(batch)
+            res.extend(self.to_image(o) for o in out)
+        return res
+
+
+default_models = None
+
+
+def get_models(models=None):
+    """None or True -> the shared default model_manager, or a model_manager object"""
+    global default_models
+    if models is None or models is True:
+        if default_models == None:
+            default_models = model_manager()
+        return default_models
+    return models
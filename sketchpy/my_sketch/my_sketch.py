@@ -1,6 +1,8 @@
-import cv2
 import turtle
+import numpy as np
 import sketchpy as custom  # Ensure your Sketchpy version supports this import
+from ..renderer import frame_counter
+from ..glyphs import get_atlas
 
 class MySketch:
     def __init__(self, image_path="your_image.jpg", ascii_width=100, font_size=16):
@@ -12,12 +14,14 @@ class MySketch:
         self.ascii_width = ascii_width
         self.font_size = font_size
 
-    def image_to_color_ascii(self):
+    def image_to_ascii_arrays(self):
         """
-        Convert the image to colored ASCII art.
-        Returns a 2D list (list of rows) where each element is a tuple (char, color),
-        with `color` as an (R, G, B) tuple.
+        Convert the image to colored ASCII art as arrays.
+        Returns (chars, colors): chars is a (rows, cols) array of single characters
+        and colors is a (rows, cols, 3) uint8 array of the (R, G, B) colors.
         """
+        import cv2
+
         # Load the image in color (BGR format)
         img = cv2.imread(self.image_path, cv2.IMREAD_COLOR)
         if img is None:
@@ -31,43 +35,79 @@ class MySketch:
         resized_img = cv2.resize(img, (new_width, new_height))
 
         # Define ASCII characters from dark to light.
-        ascii_chars = "@%#*+=-:. "
-        ascii_data = []
-
-        # Process each pixel in the resized image.
-        for row in resized_img:
-            row_data = []
-            for pixel in row:
-                # Convert BGR to RGB.
-                B, G, R = pixel
-                # Compute brightness using standard luminance conversion.
-                brightness = 0.299 * R + 0.587 * G + 0.114 * B
-                # Map brightness to an ASCII character.
-                index = int(brightness / 255 * (len(ascii_chars) - 1))
-                char = ascii_chars[index]
-                color = (R, G, B)  # Now in RGB order.
-                row_data.append((char, color))
-            ascii_data.append(row_data)
-
-        return ascii_data
-
-    def draw(self):
+        ascii_chars = np.array(list("@%#*+=-:. "))
+
+        # Convert BGR to RGB.
+        colors = np.ascontiguousarray(resized_img[:, :, ::-1])
+        # Compute brightness of every pixel using standard luminance conversion.
+        brightness = 0.299 * colors[:, :, 0] + 0.587 * colors[:, :, 1] + 0.114 * colors[:, :, 2]
+        # Map brightness to an ASCII character.
+        index = (brightness / 255 * (len(ascii_chars) - 1)).astype(np.intp)
+        return ascii_chars[index], colors
+
+    def image_to_color_ascii(self):
+        """
+        Convert the image to colored ASCII art.
+        Returns a 2D list (list of rows) where each element is a tuple (char, color),
+        with `color` as an (R, G, B) tuple.
+        """
+        chars, colors = self.image_to_ascii_arrays()
+        return [
+            [(char, tuple(color)) for char, color in zip(char_row, color_row)]
+            for char_row, color_row in zip(chars.tolist(), colors.tolist())
+        ]
+
+    def draw(self, update_every=None):
         """
         Use Sketchpy's custom function to create a sketch from the image.
+        update_every: passed on to sketch_from_image.draw.
         """
         sketch_obj = custom.sketch_from_image(self.image_path)
-        sketch_obj.draw()
+        sketch_obj.draw(update_every=update_every)
 
-    def draw_color_ascii_turtle(self):
+    def render_color_ascii(self, font=None, background=(255, 255, 255)):
+        """
+        Render the colored ASCII art offscreen.
+        The characters are rasterized once into a glyph atlas and copied into a
+        NumPy image tinted with the sampled color, so no canvas item is created.
+        font: path or name of a monospace truetype font, a system one by default.
+        Returns a (height, width, 3) uint8 RGB array.
+        """
+        chars, colors = self.image_to_ascii_arrays()
+        atlas = get_atlas("@%#*+=-:. ", self.font_size, font)
+        return atlas.render(chars, colors, background, margin=10)
+
+    def draw_color_ascii_image(self, file_name="color_ascii.png", show=True, font=None):
+        """
+        Render the colored ASCII art offscreen and save it as a PNG.
+        With show the image is displayed in a Turtle window as a single picture,
+        this works at widths where draw_color_ascii_turtle becomes unresponsive.
+        Returns the rendered image.
+        """
+        from PIL import Image
+
+        img = self.render_color_ascii(font)
+        Image.fromarray(img).save(file_name)
+        if show:
+            screen = turtle.Screen()
+            screen.setup(width=img.shape[1] + 20, height=img.shape[0] + 20)
+            screen.bgpic(file_name)
+            turtle.done()
+        return img
+
+    def draw_color_ascii_turtle(self, update_every=None):
         """
         Draw the colored ASCII art in a Turtle window.
         Each ASCII character is drawn in the color sampled from the image.
         The window has a white background.
+        Every character is a separate canvas item, for wide images use
+        draw_color_ascii_image instead.
+        update_every: None animates every character, n refreshes the window once
+        every n characters, "instant" draws everything and refreshes once.
         """
         # Generate the colored ASCII art data.
-        ascii_data = self.image_to_color_ascii()  # 2D list: each element is (char, color)
-        rows = len(ascii_data)
-        cols = self.ascii_width
+        chars, colors = self.image_to_ascii_arrays()  # (rows, cols) characters and (rows, cols, 3) colors
+        rows, cols = chars.shape
 
         # Set Turtle to use 0-255 color range.
         turtle.colormode(255)
@@ -85,6 +125,7 @@ class MySketch:
         screen = turtle.Screen()
         screen.bgcolor("white")
         screen.setup(width=window_width, height=window_height)
+        frames = frame_counter(screen, update_every)
 
         # Create a Turtle for drawing text.
         t = turtle.Turtle()
@@ -99,13 +140,15 @@ class MySketch:
         font_settings = ("Courier", self.font_size, "normal")
 
         # Draw each ASCII character individually with its sampled color.
-        for row in ascii_data:
+        for char_row, color_row in zip(chars.tolist(), colors.tolist()):
             x = x_start
-            for (char, color) in row:
+            for char, color in zip(char_row, color_row):
                 t.goto(x, y_start)
-                t.color(color)  # Set pen color to the sampled RGB value.
+                t.color(tuple(color))  # Set pen color to the sampled RGB value.
                 t.write(char, font=font_settings, align="left")
                 x += char_width
+                frames.tick()
             y_start -= char_height
 
+        frames.finish()
         turtle.done()
@@ -0,0 +1,281 @@
+import numpy as np
+
+from .reporting import log
+
+
+class grid_index:
+    def __init__(self, cell):
+        """uniform grid of points used to find the nearest pen position quickly\n
+        cell -> size of a grid cell, about the mean distance between the points works best"""
+        self.cell = cell
+        self.cells = {}
+        self.where = {}
+        self.lo = None
+        self.hi = None
+
+    def add(self, key, xy):
+        c = (int(xy[0] // self.cell), int(xy[1] // self.cell))
+        self.cells.setdefault(c, {})[key] = xy
+        self.where[key] = c
+        self.lo = c if self.lo == None else (min(self.lo[0], c[0]), min(self.lo[1], c[1]))
+        self.hi = c if self.hi == None else (max(self.hi[0], c[0]), max(self.hi[1], c[1]))
+
+    def remove(self, key):
+        c = self.where.pop(key)
+        del self.cells[c][key]
+        if len(self.cells[c]) == 0:
+            del self.cells[c]
+
+    def __len__(self):
+        return len(self.where)
+
+    def nearest(self, xy):
+        """key of the point closest to xy, searched ring by ring around the cell of xy"""
+        if len(self.where) == 0:
+            return None
+        cx, cy = int(xy[0] // self.cell), int(xy[1] // self.cell)
+        max_ring = max(abs(cx - self.lo[0]), abs(cx - self.hi[0]), abs(cy - self.lo[1]), abs(cy - self.hi[1]))
+        best, best_d = None, None
+        for r in range(max_ring + 1):
+            # xy can be anywhere in its cell, so the points of ring r and further are at least r - 1 cells away
+            if best_d != None and best_d <= ((r - 1) * self.cell) ** 2:
+                break
+            everything = (2 * r + 1) ** 2 > len(self.cells)
+            if everything:
+                # the ring covers more cells than there are left, checking every cell is cheaper
+                cells = list(self.cells)
+            else:
+                cells = [
+                    (x, y)
+                    for x in range(cx - r, cx + r + 1)
+                    for y in (range(cy - r, cy + r + 1) if x in (cx - r, cx + r) else (cy - r, cy + r))
+                ]
+            for c in cells:
+                for key, p in self.cells.get(c, {}).items():
+                    d = (p[0] - xy[0]) ** 2 + (p[1] - xy[1]) ** 2
+                    if best_d == None or d < best_d:
+                        best, best_d = key, d
+            if everything:
+                break
+        return best
+
+
+def stroke_ends(points, offsets):
+    """(starts, ends), the first and last point of every non empty stroke as float arrays"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    offsets = np.asarray(offsets)
+    return points[offsets[:-1]], points[offsets[1:] - 1]
+
+
+def travel(starts, ends, order=None, flipped=None):
+    """total pen-up distance when the strokes are drawn in order, flipped strokes are drawn from their end"""
+    if order is None:
+        order = np.arange(len(starts))
+    if flipped is None:
+        flipped = np.zeros(len(order), dtype=bool)
+    a = np.where(flipped[:, None], ends[order], starts[order])
+    b = np.where(flipped[:, None], starts[order], ends[order])
+    return float(np.sqrt(((a[1:] - b[:-1]) ** 2).sum(axis=1)).sum())
+
+
+def overlap_edges(points, offsets, colors, block=1 << 20):
+    """pairs (i, j), i < j, of strokes whose bounding boxes overlap and whose colors differ,
+    stroke i has to be drawn before stroke j to keep what is on top\n
+    the boxes are swept in order of their left side, so only the boxes that overlap in x are compared,
+    block -> maximum no of candidate pairs compared at once"""
+    points = np.asarray(points).reshape(-1, 2)
+    offsets = np.asarray(offsets)
+    n = len(offsets) - 1
+    colors = np.asarray(colors).reshape(n, -1)
+    if n < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+    lo = np.minimum.reduceat(points, offsets[:-1], axis=0)
+    hi = np.maximum.reduceat(points, offsets[:-1], axis=0)
+
+    by_x = np.argsort(lo[:, 0], kind="stable")
+    left = lo[by_x, 0]
+    # the boxes after position p in by_x that start before box by_x[p] ends, they all overlap it in x
+    stop = np.searchsorted(left, hi[by_x, 0], side="right")
+    count = np.maximum(stop - np.arange(n) - 1, 0)
+    total = np.cumsum(count)
+
+    res = []
+    p0 = 0
+    while p0 < n:
+        # as many positions as fit in a block of candidate pairs, at least one
+        p1 = max(int(np.searchsorted(total, (total[p0 - 1] if p0 else 0) + block, side="right")), p0 + 1)
+        c = count[p0:p1]
+        first = np.cumsum(c) - c
+        owner = np.repeat(np.arange(p0, p1), c)
+        other = owner + 1 + np.arange(len(owner)) - np.repeat(first, c)
+        i, j = by_x[owner], by_x[other]
+        hit = (
+            (lo[i, 1] <= hi[j, 1])
+            & (lo[j, 1] <= hi[i, 1])
+            & (colors[i] != colors[j]).any(axis=1)
+        )
+        i, j = i[hit], j[hit]
+        res.append(np.stack([np.minimum(i, j), np.maximum(i, j)], axis=1))
+        p0 = p1
+    return np.concatenate(res).astype(np.int64)
+
+
+def nearest_neighbour(starts, ends, reverse=True, edges=None):
+    """greedy order, the next stroke is the one with the closest end point to the pen among the strokes
+    whose predecessors in edges are all drawn\n
+    returns (order, flipped)"""
+    n = len(starts)
+    preds = np.zeros(n, dtype=np.int64)
+    succs = [[] for _ in range(n)]
+    if edges is not None:
+        for i, j in edges.tolist():
+            preds[j] += 1
+            succs[i].append(j)
+
+    span = np.ptp(np.concatenate([starts, ends]), axis=0).max() if n else 0
+    index = grid_index(max(span / max(np.sqrt(n), 1), 1e-9))
+
+    def add(i):
+        index.add((i, False), tuple(starts[i]))
+        if reverse:
+            index.add((i, True), tuple(ends[i]))
+
+    for i in np.flatnonzero(preds == 0).tolist():
+        add(i)
+
+    order = []
+    flipped = []
+    pen = tuple(starts[0]) if n else (0, 0)
+    while len(index):
+        i, flip = index.nearest(pen)
+        index.remove((i, False))
+        if reverse:
+            index.remove((i, True))
+        order.append(i)
+        flipped.append(flip)
+        pen = tuple(starts[i] if flip else ends[i])
+        for j in succs[i]:
+            preds[j] -= 1
+            if preds[j] == 0:
+                add(j)
+    return np.array(order, dtype=np.int64), np.array(flipped, dtype=bool)
+
+
+def two_opt(starts, ends, order, flipped, window=32, passes=8, edges=None, min_gain=1e-3, block=1 << 16):
+    """improves an order by reversing runs of at most window strokes, every stroke of a reversed run is
+    drawn the other way round, so it needs strokes that can be reversed\n
+    every pass computes the gain of every reversal at once, then reverses the best run starting at every
+    position that does not touch a run already reversed in the pass, the passes stop once a pass shortens
+    the travel by less than min_gain of it\n
+    edges -> pairs (i, j) where stroke i has to be drawn before stroke j, the runs holding both strokes
+    of a pair are not reversed\n
+    block -> maximum no of positions whose gains are computed at once"""
+    order, flipped = order.copy(), flipped.copy()
+    a = np.where(flipped[:, None], ends[order], starts[order])
+    b = np.where(flipped[:, None], starts[order], ends[order])
+    n = len(order)
+    dist = lambda p, q: np.sqrt(((p - q) ** 2).sum(axis=-1))
+    if edges is not None and len(edges) == 0:
+        edges = None
+
+    def gains(p, latest):
+        """gain[i, k] of reversing p[i] + 1 .. p[i] + 1 + k, 0 past the end of the order and for the
+        runs that are not allowed"""
+        q = p[:, None] + np.arange(1, window + 1)
+        inside = q < n
+        q = np.minimum(q, n - 1)
+        # reversing p + 1 .. q joins b[p] to b[q] and a[p + 1] to a[q + 1]
+        nxt = np.minimum(q + 1, n - 1)
+        last = q == n - 1
+        old = dist(b[p], a[p + 1])[:, None] + np.where(last, 0, dist(b[q], a[nxt]))
+        new = dist(b[p][:, None], b[q]) + np.where(last, 0, dist(a[p + 1][:, None], a[nxt]))
+        if latest is not None:
+            # reversing p + 1 .. q is only allowed when no stroke of the run has a predecessor in it
+            inside &= np.maximum.accumulate(latest[q], axis=1) < p[:, None] + 1
+        return np.where(inside, old - new, 0)
+
+    total = travel(starts, ends, order, flipped)
+    for _ in range(passes if n > 2 else 0):
+        latest = None
+        if edges is not None:
+            # position in the order of the last drawn predecessor of the stroke at every position, -1 when
+            # it has none, the reversals of the pass only move predecessors within runs before the later
+            # runs, so it stays right for the runs not reversed yet
+            pos = np.empty(n, dtype=np.int64)
+            pos[order] = np.arange(n)
+            latest = np.full(n, -1, dtype=np.int64)
+            np.maximum.at(latest, pos[edges[:, 1]], pos[edges[:, 0]])
+
+        # the positions where some reversal shortens the travel, with the gains of all their runs
+        cand, cand_gain = [], []
+        for p0 in range(0, n - 2, block):
+            p = np.arange(p0, min(p0 + block, n - 2))
+            gain = gains(p, latest)
+            keep = gain.max(axis=1) > 1e-9
+            cand.append(p[keep])
+            cand_gain.append(gain[keep])
+
+        saved = 0.0
+        free = 0
+        # the gains of a run only depend on the strokes from p to q + 1, so the runs after the last
+        # reversed one still have the gains computed above
+        for p, gain in zip(np.concatenate(cand).tolist(), np.concatenate(cand_gain)):
+            if p < free:
+                continue
+            k = int(np.argmax(gain))
+            s = slice(p + 1, p + 2 + k)
+            order[s] = order[s][::-1]
+            flipped[s] = ~flipped[s][::-1]
+            a[s], b[s] = b[s][::-1].copy(), a[s][::-1].copy()
+            saved += float(gain[k])
+            free = p + 2 + k
+        total -= saved
+        if saved <= min_gain * total:
+            break
+    return order, flipped
+
+
+def order_strokes(points, offsets, colors=None, reverse=True):
+    """reorders strokes to shorten the pen-up travel between them\n
+    points, offsets -> stroke i is points[offsets[i]:offsets[i + 1]]\n
+    colors -> color of every stroke, when given overlapping strokes of different colors keep their order\n
+    reverse -> allow drawing a stroke from its end\n
+    returns (order, flipped, before, after), the travel before and after is in the units of the points"""
+    offsets = np.asarray(offsets)
+    full = np.flatnonzero(offsets[1:] > offsets[:-1])
+    empty = np.flatnonzero(offsets[1:] == offsets[:-1])
+    # empty strokes hold no points, so the non empty ones alone still cover all the points
+    full_offsets = np.append(offsets[full], offsets[-1])
+    starts, ends = stroke_ends(points, full_offsets)
+
+    edges = None
+    if colors is not None:
+        edges = overlap_edges(points, full_offsets, np.asarray(colors)[full])
+
+    before = travel(starts, ends)
+    order, flipped = nearest_neighbour(starts, ends, reverse, edges)
+    if reverse:
+        order, flipped = two_opt(starts, ends, order, flipped, edges=edges)
+    after = travel(starts, ends, order, flipped)
+    if after > before:
+        order, flipped, after = np.arange(len(full)), np.zeros(len(full), dtype=bool), before
+    return np.concatenate([full[order], empty]), np.concatenate([flipped, np.zeros(len(empty), dtype=bool)]), before, after
+
+
+def reorder_paths(points, offsets, colors=None, reverse=True, stage="pen travel"):
+    """applies order_strokes to (points, offsets) and reports the travel before and after\n
+    returns (points, offsets, order), stroke i of the result is stroke order[i] of the input"""
+    points = np.asarray(points)
+    offsets = np.asarray(offsets)
+    order, flipped, before, after = order_strokes(points, offsets, colors, reverse)
+    if before > 0:
+        log(f"{stage}: {before:.0f} -> {after:.0f} ({100 - 100 * after / before:.0f}% shorter)")
+
+    parts = []
+    for i, flip in zip(order.tolist(), flipped.tolist()):
+        stroke = points[offsets[i] : offsets[i + 1]]
+        parts.append(stroke[::-1] if flip else stroke)
+    new_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(np.diff(offsets)[order], out=new_offsets[1:])
+    new_points = np.concatenate(parts) if parts else points[:0]
+    return new_points, new_offsets, order
@@ -0,0 +1,173 @@
+import numpy as np
+
+
+MAGIC = 0x43504B53  # "SKPC"
+VERSION = 2
+HEADER_SIZE = 8
+
+
+def subpath_breaks(points, offsets):
+    """indices of the points where a new filled subpath starts: the first point of every path, and every
+    point that shows up again later in the same path (the start of a closed subpath), found in one pass
+    over all the paths instead of scanning the rest of the path for every point"""
+    points = np.asarray(points).reshape(-1, 2)
+    offsets = np.asarray(offsets)
+    n = len(points)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    path_id = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    rows = np.stack([path_id, points[:, 0], points[:, 1]], axis=1)
+    _, inverse = np.unique(rows, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    last = np.full(inverse.max() + 1, -1, dtype=np.int64)
+    np.maximum.at(last, inverse, np.arange(n))
+    brk = last[inverse] > np.arange(n)
+    starts = offsets[:-1][offsets[:-1] < offsets[1:]]
+    brk[starts] = True
+    return np.flatnonzero(brk)
+
+
+class path_data:
+    def __init__(self, points, offsets, colors, height, width, scale, breaks=None):
+        """flat storage of the sketch paths\n
+        points -> (n, 2) int32 array holding the points of all the paths\n
+        offsets -> path i is points[offsets[i]:offsets[i + 1]]\n
+        colors -> (no of paths, 3) float32 array of rgb colors in the 0-1 range\n
+        height, width, scale -> size of the svg and the zoom value used while sampling it\n
+        breaks -> sorted indices of the points starting a filled subpath, computed when not given"""
+        self.points = points
+        self.offsets = offsets
+        self.colors = colors
+        self.height = height
+        self.width = width
+        self.scale = scale
+        if breaks is None:
+            breaks = subpath_breaks(points, offsets)
+        self.breaks = breaks
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def path(self, n):
+        return self.points[self.offsets[n] : self.offsets[n + 1]]
+
+    def subpaths(self, n):
+        """the points of path n split into its filled subpaths"""
+        start, end = self.offsets[n], self.offsets[n + 1]
+        lo, hi = np.searchsorted(self.breaks, [start, end])
+        return np.split(self.points[start:end], np.asarray(self.breaks[lo + 1 : hi]) - start)
+
+    def __iter__(self):
+        """yields (list of (x, y), color) for every path, like the old list format"""
+        for n in range(len(self)):
+            yield [tuple(p) for p in self.path(n).tolist()], tuple(self.colors[n].tolist())
+
+    def save(self, file_name):
+        save_paths(file_name, self)
+
+
+def from_path_list(coordinates):
+    """converts the old [[height, width, scale], (points, color), ...] list to path_data"""
+    height, width = coordinates[0][0], coordinates[0][1]
+    scale = coordinates[0][2] if len(coordinates[0]) > 2 else None
+    lengths = [len(p[0]) for p in coordinates[1:]]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    points = np.array([xy for p in coordinates[1:] for xy in p[0]], dtype=np.int32).reshape(-1, 2)
+    colors = np.array([p[1] for p in coordinates[1:]], dtype=np.float32).reshape(-1, 3)
+    return path_data(points, offsets, colors, height, width, scale)
+
+
+def save_paths(file_name, data):
+    """writes the path data to file_name as a single flat int32 .npy file, no pickling is involved\n
+    layout: header (magic, version, height, width, scale, no of paths, no of points, no of breaks),
+    offsets, colors (float32 bits), points and the subpath breaks"""
+    n_paths = len(data)
+    n_points = len(data.points)
+    header = np.zeros(HEADER_SIZE, dtype=np.int32)
+    header[:] = (MAGIC, VERSION, data.height, data.width, 0, n_paths, n_points, len(data.breaks))
+    header[4:5] = np.array([data.scale], dtype=np.float32).view(np.int32)
+
+    buf = np.concatenate(
+        [
+            header,
+            np.asarray(data.offsets, dtype=np.int32),
+            np.ascontiguousarray(data.colors, dtype=np.float32).reshape(-1).view(np.int32),
+            np.ascontiguousarray(data.points, dtype=np.int32).reshape(-1),
+            np.asarray(data.breaks, dtype=np.int32),
+        ]
+    )
+    np.save(file_name, buf, allow_pickle=False)
+
+
+def is_path_file(file_name):
+    """True when file_name was written by save_paths"""
+    try:
+        buf = np.load(file_name, mmap_mode="r", allow_pickle=False)
+    except ValueError:
+        return False
+    return buf.dtype == np.int32 and buf.ndim == 1 and len(buf) >= HEADER_SIZE and buf[0] == MAGIC
+
+
+def load_paths(file_name, mmap=True):
+    """reads a file written by save_paths, with mmap the arrays are views on the memory mapped file
+    so nothing is read before it is drawn"""
+    buf = np.load(file_name, mmap_mode="r" if mmap else None, allow_pickle=False)
+    if buf.dtype != np.int32 or buf.ndim != 1 or len(buf) < HEADER_SIZE or buf[0] != MAGIC:
+        raise ValueError(f"{file_name} is not a sketchpy path file")
+    if buf[1] > VERSION:
+        raise ValueError(f"unsupported path file version {buf[1]}")
+
+    height, width = int(buf[2]), int(buf[3])
+    scale = float(np.asarray(buf[4:5]).view(np.float32)[0])
+    n_paths, n_points = int(buf[5]), int(buf[6])
+
+    start = HEADER_SIZE
+    offsets = buf[start : start + n_paths + 1]
+    start += n_paths + 1
+    colors = buf[start : start + n_paths * 3].view(np.float32).reshape(n_paths, 3)
+    start += n_paths * 3
+    points = buf[start : start + n_points * 2].reshape(n_points, 2)
+    start += n_points * 2
+    breaks = None
+    if buf[1] >= 2:
+        breaks = buf[start : start + int(buf[7])]
+    return path_data(points, offsets, colors, height, width, scale, breaks)
+
+
+def read_paths(file_name, allow_pickle=False):
+    """loads the sketch data saved by load_svg, files written by older versions hold pickled python objects
+    and are only loaded with allow_pickle=True, never do that for files you do not trust"""
+    if is_path_file(file_name):
+        return load_paths(file_name)
+    if not allow_pickle:
+        raise ValueError(
+            f"{file_name} was saved by an older version of sketchpy, pass allow_pickle=True to load it if you trust the file"
+        )
+    return np.load(file_name, allow_pickle=True)
+
+
+def split_paths(coordinates):
+    """returns ([height, width, scale], path_data) for path_data as well as for the old [[height, width, scale], (points, color), ...] list"""
+    if not isinstance(coordinates, path_data):
+        coordinates = from_path_list(coordinates)
+    return [coordinates.height, coordinates.width, coordinates.scale], coordinates
+
+
+def save_contours(file_name, contours, height, width):
+    """saves a list of opencv contours in the path file format"""
+    lengths = [len(c) for c in contours]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if len(contours):
+        points = np.concatenate([c.reshape(-1, 2) for c in contours])
+    else:
+        points = np.zeros((0, 2), dtype=np.int32)
+    colors = np.zeros((len(contours), 3), dtype=np.float32)
+    save_paths(file_name, path_data(points, offsets, colors, height, width, 1, offsets[:-1]))
+
+
+def load_contours(file_name):
+    """loads contours saved by save_contours as a list of (n, 1, 2) int32 arrays, like cv2.findContours returns them"""
+    data = load_paths(file_name, mmap=False)
+    return [data.path(n).reshape(-1, 1, 2) for n in range(len(data))]
@@ -0,0 +1,144 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from .sampling import sample_path
+from .pathcache import subpath_breaks
+from .reporting import log, ERROR
+
+
+def hex_to_rgb(string):
+    strlen = len(string)
+    if string.startswith("#"):
+        if strlen == 7:
+            r = string[1:3]
+            g = string[3:5]
+            b = string[5:7]
+        elif strlen == 4:
+            r = string[1:2] * 2
+            g = string[2:3] * 2
+            b = string[3:4] * 2
+    elif strlen == 3:
+        r = string[0:1] * 2
+        g = string[1:2] * 2
+        b = string[2:3] * 2
+    else:
+        r = string[0:2]
+        g = string[2:4]
+        b = string[4:6]
+
+    return int(r, 16) / 255, int(g, 16) / 255, int(b, 16) / 255
+
+
+def chunked(lst, size):
+    return [lst[i : i + size] for i in range(0, len(lst), size)]
+
+
+def imap_ordered(fn, items, workers=1):
+    """applies fn on every item and yields the results in the order of the items\n
+    workers -> number of processes, 1 or less runs everything in the current process\n
+
+    at most 2 * workers items are in flight at a time, so results that were not consumed yet
+    do not pile up in memory"""
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def sample_svg_chunk(attributes, width, height, scale, tolerance, pre_offset=(0, 0), post_offset=(0, 0)):
+    """samples a chunk of svg path attributes (as returned by svg2paths2) into a single batch\n
+    every point is mapped as int(((p + translate - pre_offset) / size) * scale) - post_offset\n
+
+    returns (points, offsets, colors, breaks, errors), points is a (n, 2) int32 array holding the points of all the paths,
+    path i is points[offsets[i]:offsets[i + 1]], colors[i] is its rgb fill color and breaks are the indices of
+    the points starting a filled subpath, errors is a list of (index in attributes, message) of the paths that were skipped"""
+    from svg.path import parse_path
+
+    points = []
+    colors = []
+    lengths = []
+    errors = []
+    for n, i in enumerate(attributes):
+        try:
+            path = parse_path(i["d"])
+            col = hex_to_rgb(i["fill"])
+            transform = i["transform"].replace("translate(", "").replace(")", "")
+            transform = list(map(float, transform.split(",")))
+            transform = list(map(int, transform))
+        except Exception as e:
+            errors.append((n, f"{type(e).__name__}: {e}"))
+            continue
+
+        p = sample_path(path, tolerance * min(width, height) / scale)
+        xs = (((p.real + transform[0] - pre_offset[0]) / width) * scale).astype(np.int32) - post_offset[0]
+        ys = (((p.imag + transform[1] - pre_offset[1]) / height) * scale).astype(np.int32) - post_offset[1]
+        points.append(np.stack([xs, ys], axis=1).astype(np.int32))
+        colors.append(col)
+        lengths.append(len(p))
+
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if len(points):
+        points = np.concatenate(points)
+    else:
+        points = np.zeros((0, 2), dtype=np.int32)
+    colors = np.array(colors, dtype=np.float32).reshape(-1, 3)
+    return points, offsets, colors, subpath_breaks(points, offsets), errors
+
+
+def merge_batches(batches):
+    """joins batches returned by sample_svg_chunk into one (points, offsets, colors, breaks) batch, keeping their order"""
+    points = []
+    colors = []
+    offsets = [np.zeros(1, dtype=np.int64)]
+    breaks = []
+    total = 0
+    for pts, offs, cols, brks, _ in batches:
+        points.append(pts)
+        colors.append(cols)
+        offsets.append(offs[1:] + total)
+        breaks.append(brks + total)
+        total += len(pts)
+    if len(points) == 0:
+        return np.zeros((0, 2), dtype=np.int32), offsets[0], np.zeros((0, 3), dtype=np.float32), np.zeros(0, dtype=np.int64)
+    return np.concatenate(points), np.concatenate(offsets), np.concatenate(colors), np.concatenate(breaks)
+
+
+def sample_svg(attributes, width, height, scale, tolerance, pre_offset=(0, 0), post_offset=(0, 0), workers=1, chunk_size=64, progress=None):
+    """samples all the svg paths, the chunks are spread over a pool of worker processes and the paths
+    come back in the same order as the attributes so the z-order of the drawing is kept\n
+    workers -> number of worker processes, 1 samples the paths in the current process\n
+    chunk_size -> number of paths sent to a worker at a time\n
+    progress -> optional callable, called with the number of paths finished after every chunk\n
+    the paths that can not be parsed are skipped and reported as errors"""
+    fn = partial(
+        sample_svg_chunk,
+        width=width,
+        height=height,
+        scale=scale,
+        tolerance=tolerance,
+        pre_offset=pre_offset,
+        post_offset=post_offset,
+    )
+    batches = []
+    chunks = chunked(attributes, chunk_size)
+    for n, batch in enumerate(imap_ordered(fn, chunks, workers)):
+        batches.append(batch)
+        for i, message in batch[4]:
+            log(f"skipped svg path {n * chunk_size + i}: {message}", level=ERROR)
+        if progress != None:
+            progress(len(chunks[n]))
+    return merge_batches(batches)
+
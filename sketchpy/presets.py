@@ -0,0 +1,211 @@
+import json
+import os
+
+import numpy as np
+
+from . import coords
+from .reporting import log
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "presets")
+INDEX_FILE = "index.json"
+
+_index = None
+_loaded = {}
+arts = {}
+
+
+def split_markers(coord):
+    """turns an old coordinate list, where (-1, -1) starts a new stroke, into (points, offsets),
+    points is a (n, 2) int16 array without the markers and stroke i is points[offsets[i]:offsets[i + 1]]"""
+    points, offsets = coords.split_markers(coord)
+    if len(points) and (points.min() < np.iinfo(np.int16).min or points.max() > np.iinfo(np.int16).max):
+        raise ValueError("the coordinates do not fit in int16")
+    return points.astype(np.int16), offsets
+
+
+class preset_data:
+    def __init__(self, name, points, parts):
+        """the strokes of a preset\n
+        points -> (n, 2) int16 array holding the points of all the parts, memory mapped from the asset file\n
+        parts -> dict of part name -> offsets, stroke i of the part is points[offsets[i]:offsets[i + 1]]"""
+        self.name = name
+        self.points = points
+        self.parts = parts
+
+    def __contains__(self, part):
+        return part in self.parts
+
+    def __getitem__(self, part):
+        """list of (n, 2) int16 arrays, one for every stroke of the part"""
+        offsets = self.parts[part]
+        return [self.points[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    def names(self):
+        return list(self.parts)
+
+
+def load_index(directory=ASSET_DIR):
+    global _index
+    if directory != ASSET_DIR:
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            return json.load(f)
+    if _index == None:
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            _index = json.load(f)
+    return _index
+
+
+def load_preset(name):
+    """loads the strokes of the preset name, the points are only memory mapped the first time
+    and shared by every object drawing the same preset"""
+    if name not in _loaded:
+        index = load_index()
+        if name not in index:
+            raise ValueError(f"no preset named {name}")
+        entry = index[name]
+        points = np.load(os.path.join(ASSET_DIR, entry["file"]), mmap_mode="r", allow_pickle=False)
+        _loaded[name] = preset_data(name, points, entry["parts"])
+    return _loaded[name]
+
+
+def load_text(name):
+    """loads a text preset (like an ascii art) as a list of lines"""
+    entry = load_index()[name]
+    with open(os.path.join(ASSET_DIR, entry["file"])) as f:
+        return f.readlines()
+
+
+def pack_preset(name, parts, directory=ASSET_DIR):
+    """writes a preset to the asset store\n
+    name -> name of the preset\n
+    parts -> dict of part name -> coordinate list using (-1, -1) markers, or a list of lines for a text preset"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, INDEX_FILE)
+    index = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            index = json.load(f)
+
+    if isinstance(parts, list):
+        file_name = name + ".txt"
+        with open(os.path.join(directory, file_name), "w") as f:
+            f.writelines(parts)
+        index[name] = {"file": file_name}
+    else:
+        points = []
+        offsets = {}
+        total = 0
+        for part, coord in parts.items():
+            pts, offs = split_markers(coord)
+            points.append(pts)
+            offsets[part] = (offs + total).tolist()
+            total += len(pts)
+        file_name = name + ".npy"
+        np.save(os.path.join(directory, file_name), np.concatenate(points), allow_pickle=False)
+        index[name] = {"file": file_name, "parts": offsets}
+
+    with open(path, "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+    _loaded.pop(name, None)
+    if directory == ASSET_DIR:
+        global _index
+        _index = None
+
+
+class preset_sketch:
+    def __init__(self, name, x_offset=300, y_offset=300, renderer=None, hide=True, reorder=False):
+        """draws the strokes of a preset, shared by all the ready made sketches of the library\n
+        name -> name of the preset in the asset store\n
+        x_offset, y_offset -> position of the image being drawn\n
+        renderer -> where to draw, a turtle window by default (see sketchpy.renderer)\n
+        hide -> hide the turtle pen while sketching\n
+        reorder -> draw the strokes of every part in the order that shortens the pen travel, the strokes of a part
+        share one color so the drawing stays the same (see sketchpy.ordering)"""
+        from .renderer import get_renderer
+
+        self.parts = load_preset(name)
+        self.renderer = get_renderer(renderer, hide=hide)
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+        self.reorder = reorder
+        self.frames = None
+        self.travel = [0, 0]
+
+    def to_screen(self, stroke):
+        """maps the image coordinates of a stroke to screen coordinates, as a list of (x, y)"""
+        pts = np.empty((len(stroke), 2), dtype=np.int32)
+        pts[:, 0] = stroke[:, 0]
+        pts[:, 0] -= self.x_offset
+        pts[:, 1] = self.y_offset
+        pts[:, 1] -= stroke[:, 1]
+        return pts.tolist()
+
+    def start(self, update_every=None):
+        """called by draw before the first part, update_every -> None animates every pen move, a number n
+        refreshes the screen once every n strokes, "instant" draws everything and refreshes once"""
+        from .renderer import frame_counter
+
+        self.frames = frame_counter(self.renderer, update_every)
+
+    def draw_fn(self, coord, mode=1, co=(0, 0, 0), thickness=1):
+        """coord -> list of strokes, each one a (n, 2) array of points, like a part of the preset\n
+        mode -> 1 draws the strokes as lines, 0 fills them\n
+        co -> rgb color in the 0-255 range\n
+        thickness -> width of the lines, only used with mode 1"""
+        if self.frames == None:
+            self.start()
+        if self.reorder and len(coord) > 1:
+            coord = self.ordered(coord)
+        self.renderer.color((co[0] / 255, co[1] / 255, co[2] / 255))
+        if mode:
+            self.renderer.width(thickness)
+            for stroke in coord:
+                self.renderer.polyline(self.to_screen(stroke))
+                self.frames.tick()
+        else:
+            for stroke in coord:
+                self.renderer.polygon(self.to_screen(stroke))
+                self.frames.tick()
+
+    def ordered(self, coord):
+        """the strokes in the order given by ordering.order_strokes, the travel saved is added to self.travel"""
+        from .ordering import order_strokes
+
+        offsets = np.zeros(len(coord) + 1, dtype=np.int64)
+        np.cumsum([len(stroke) for stroke in coord], out=offsets[1:])
+        order, flipped, before, after = order_strokes(np.concatenate(coord), offsets)
+        self.travel[0] += before
+        self.travel[1] += after
+        return [coord[i][::-1] if flip else coord[i] for i, flip in zip(order.tolist(), flipped.tolist())]
+
+    def finish(self, retain=True):
+        """refreshes the screen once everything is drawn, with retain the window is kept open"""
+        if self.reorder and self.travel[0] > 0:
+            before, after = self.travel
+            log(f"pen travel: {before:.0f} -> {after:.0f} ({100 - 100 * after / before:.0f}% shorter)")
+            self.travel = [0, 0]
+        if self.frames != None:
+            self.frames.finish()
+            self.frames = None
+        if retain:
+            self.renderer.done()
+
+
+def register(name, description=""):
+    """class decorator adding a ready made sketch to the registry"""
+    def wrap(cls):
+        arts[name] = (cls, description)
+        return cls
+    return wrap
+
+
+def list_arts():
+    """list of (name, description) of the ready made sketches"""
+    return [(name, description) for name, (_, description) in arts.items()]
+
+
+def get_art(name, **kwargs):
+    """creates the ready made sketch name, kwargs are passed on to it (like x_offset and y_offset)"""
+    if name not in arts:
+        raise ValueError(f"no art named {name}, available arts are {', '.join(arts)}")
+    return arts[name][0](**kwargs)
@@ -0,0 +1,290 @@
+class turtle_renderer:
+    def __init__(self, speed=0, shape=None, hide=False):
+        """draws on a turtle window, this is the default renderer used by every canvas class\n
+        speed -> speed of the turtle pen\n
+        shape -> shape of the turtle pen (arrow, turtle, circle, ...)\n
+        hide -> hide the turtle pen while sketching"""
+        import turtle as tu
+
+        self.screen = tu.Screen()
+        self.pen = tu.Turtle()
+        self.pen.speed(speed)
+        if shape != None:
+            self.pen.shape(shape)
+        if hide:
+            self.pen.hideturtle()
+
+    def setup(self, width, height):
+        self.screen.setup(width=width, height=height)
+
+    def screensize(self, width, height):
+        self.screen.screensize(width, height)
+
+    def window_width(self):
+        return self.screen.window_width()
+
+    def window_height(self):
+        return self.screen.window_height()
+
+    def colormode(self, mode):
+        self.screen.colormode(mode)
+
+    def bgcolor(self, color):
+        self.screen.bgcolor(color)
+
+    def tracer(self, n):
+        self.screen.tracer(n)
+
+    def update(self):
+        self.screen.update()
+
+    def color(self, color):
+        self.pen.color(color)
+
+    def width(self, width):
+        self.pen.width(width)
+
+    def move_to(self, x, y):
+        self.pen.up()
+        self.pen.goto(x, y)
+        self.pen.down()
+
+    def line_to(self, x, y):
+        self.pen.goto(x, y)
+
+    def begin_fill(self):
+        self.pen.begin_fill()
+
+    def end_fill(self):
+        self.pen.end_fill()
+
+    def polyline(self, points):
+        """draws a connected line through the points, the pen is lifted before the first point"""
+        if len(points) == 0:
+            return
+        self.move_to(*points[0])
+        for x, y in points[1:]:
+            self.pen.goto(x, y)
+
+    def lines(self, segments):
+        """draws separate straight lines, segments is a list of ((x0, y0), (x1, y1)), the pen is lifted between them"""
+        for a, b in segments:
+            self.move_to(*a)
+            self.pen.goto(*b)
+
+    def polygon(self, points):
+        """draws and fills a closed shape through the points with the current color"""
+        if len(points) == 0:
+            return
+        self.move_to(*points[0])
+        self.pen.begin_fill()
+        for x, y in points[1:]:
+            self.pen.goto(x, y)
+        self.pen.end_fill()
+
+    def hide(self):
+        self.pen.hideturtle()
+
+    def save(self, file_name="sketch.png"):
+        from PIL import ImageGrab
+
+        image = ImageGrab.grab()
+        image.save(file_name)
+
+    def done(self):
+        self.screen.mainloop()
+
+
+class raster_renderer:
+    def __init__(self, width=None, height=None, background="white"):
+        """draws straight into an offscreen image buffer, no window or display server is needed\n
+        width, height -> size of the image, when not given the size requested by the canvas class is used (default 800x800)\n
+        background -> background color of the image\n
+
+        the coordinates are the same as turtle, (0, 0) is the center of the image and y grows upwards"""
+        self.size = (width, height) if width != None and height != None else None
+        self.hint = (800, 800)
+        self.background = background
+        self.mode = 1.0
+        self.pen_color = (0, 0, 0)
+        self.pen_width = 1
+        self.image = None
+        self.draw = None
+        self.stroke = []
+        self.fill = None
+
+    def _canvas(self):
+        if self.image is None:
+            from PIL import Image, ImageDraw
+
+            w, h = self.size if self.size != None else self.hint
+            self.image = Image.new("RGB", (int(w), int(h)), self._rgb(self.background))
+            self.draw = ImageDraw.Draw(self.image)
+        return self.draw
+
+    def _rgb(self, color):
+        if isinstance(color, str):
+            from PIL import ImageColor
+
+            return ImageColor.getrgb(color)[:3]
+        if self.mode == 255:
+            return tuple(int(c) for c in color[:3])
+        return tuple(int(round(c * 255)) for c in color[:3])
+
+    def _xy(self, x, y):
+        w, h = self.image.size
+        return (x + w / 2, h / 2 - y)
+
+    def _flush_stroke(self):
+        if len(self.stroke) > 1:
+            self._canvas().line(self.stroke, fill=self.pen_color, width=self.pen_width, joint="curve")
+        self.stroke = []
+
+    def setup(self, width, height):
+        if self.size == None and self.image is None:
+            self.hint = (width, height)
+
+    def screensize(self, width, height):
+        self.setup(width, height)
+
+    def window_width(self):
+        return (self.size or self.hint)[0]
+
+    def window_height(self):
+        return (self.size or self.hint)[1]
+
+    def colormode(self, mode):
+        self.mode = mode
+
+    def bgcolor(self, color):
+        self.background = color
+        if self.image is not None:
+            self._flush_stroke()
+            self.draw.rectangle([(0, 0), self.image.size], fill=self._rgb(color))
+
+    def tracer(self, n):
+        pass
+
+    def update(self):
+        self._flush_stroke()
+
+    def color(self, color):
+        self._flush_stroke()
+        self.pen_color = self._rgb(color)
+
+    def width(self, width):
+        self._flush_stroke()
+        self.pen_width = int(width)
+
+    def move_to(self, x, y):
+        self._flush_stroke()
+        self._canvas()
+        self.stroke = [self._xy(x, y)]
+        if self.fill != None:
+            self.fill.append(self._xy(x, y))
+
+    def line_to(self, x, y):
+        self._canvas()
+        point = self._xy(x, y)
+        self.stroke.append(point)
+        if self.fill != None:
+            self.fill.append(point)
+
+    def begin_fill(self):
+        self._canvas()
+        self.fill = self.stroke[-1:]
+
+    def end_fill(self):
+        if self.fill != None and len(self.fill) > 2:
+            self._canvas().polygon(self.fill, fill=self.pen_color, outline=self.pen_color)
+        self.fill = None
+
+    def polyline(self, points):
+        """draws a connected line through the points in a single call"""
+        self._flush_stroke()
+        self._canvas()
+        xy = [self._xy(x, y) for x, y in points]
+        if len(xy) > 1:
+            self.draw.line(xy, fill=self.pen_color, width=self.pen_width, joint="curve")
+        elif len(xy) == 1:
+            self.draw.point(xy, fill=self.pen_color)
+        if len(xy):
+            self.stroke = xy[-1:]
+
+    def lines(self, segments):
+        """draws separate straight lines, segments is a list of ((x0, y0), (x1, y1)), the pen is lifted between them"""
+        self._flush_stroke()
+        self._canvas()
+        for a, b in segments:
+            self.draw.line([self._xy(*a), self._xy(*b)], fill=self.pen_color, width=self.pen_width)
+        if len(segments):
+            self.stroke = [self._xy(*segments[-1][1])]
+
+    def polygon(self, points):
+        """fills a closed shape through the points in a single call"""
+        self._flush_stroke()
+        self._canvas()
+        xy = [self._xy(x, y) for x, y in points]
+        if len(xy) > 2:
+            self.draw.polygon(xy, fill=self.pen_color, outline=self.pen_color)
+        elif len(xy) > 0:
+            self.draw.line(xy, fill=self.pen_color, width=self.pen_width)
+        if len(xy):
+            self.stroke = xy[-1:]
+
+    def hide(self):
+        pass
+
+    def get_image(self):
+        """returns the rendered PIL image"""
+        self._flush_stroke()
+        self._canvas()
+        return self.image
+
+    def save(self, file_name="sketch.png"):
+        self.get_image().save(file_name)
+
+    def done(self):
+        self._flush_stroke()
+
+
+class frame_counter:
+    def __init__(self, renderer, update_every=None):
+        """controls how often the screen is refreshed while drawing, every drawing class accepts the same update_every\n
+        renderer -> anything with tracer(n) and update(), a renderer or a turtle screen\n
+        update_every -> None keeps the default animation of the class,
+        a number n turns the animation off and refreshes once every n drawn primitives (strokes, shapes, characters or rows),
+        "instant" draws everything and refreshes once at the end"""
+        if update_every != None and update_every != "instant":
+            if isinstance(update_every, str) or int(update_every) < 1:
+                raise ValueError('update_every should be None, "instant" or a positive number')
+            update_every = int(update_every)
+        self.renderer = renderer
+        self.every = update_every
+        self.count = 0
+        if update_every != None:
+            renderer.tracer(0)
+
+    def tick(self, n=1):
+        """call after drawing n strokes"""
+        if self.every == None or self.every == "instant":
+            return
+        self.count += n
+        if self.count >= self.every:
+            self.renderer.update()
+            self.count = 0
+
+    def finish(self):
+        """refreshes the screen with whatever was drawn since the last update"""
+        self.renderer.update()
+        self.count = 0
+
+
+def get_renderer(renderer=None, **kwargs):
+    """returns the given renderer, or a new turtle_renderer when renderer is None\n
+    renderer can also be the name of a backend, "turtle" or "raster" """
+    if renderer == None or renderer == "turtle":
+        return turtle_renderer(**kwargs)
+    if renderer == "raster":
+        return raster_renderer()
+    return renderer
@@ -0,0 +1,88 @@
+import sys
+import time
+
+
+SILENT, ERROR, INFO, DEBUG = -1, 0, 1, 2
+
+settings = {"verbosity": INFO, "interval": 0.5, "callback": None}
+
+
+def configure(verbosity=None, interval=None, callback=None):
+    """sets how sketchpy reports what it is doing, shared by every class of the package\n
+    verbosity -> SILENT (-1) prints nothing, ERROR (0) only errors, INFO (1, default) messages and progress,
+    DEBUG (2) also the details\n
+    interval -> minimum no of seconds between two progress reports\n
+    callback -> callback(stage, done, total) is called on every progress report instead of printing a bar,
+    pass False to go back to printing"""
+    if verbosity != None:
+        settings["verbosity"] = verbosity
+    if interval != None:
+        settings["interval"] = interval
+    if callback is False:
+        settings["callback"] = None
+    elif callback != None:
+        settings["callback"] = callback
+
+
+def enabled(level=INFO):
+    return level <= settings["verbosity"]
+
+
+def log(*args, level=INFO):
+    """prints the message when the verbosity is at least level"""
+    if enabled(level):
+        print(*args, file=sys.stderr if level == ERROR else sys.stdout)
+
+
+class progress_bar:
+    def __init__(self, total, stage="", level=INFO):
+        """reports the progress of a loop at most once every interval seconds\n
+        total -> no of steps\n
+        stage -> name of the step shown in the report, like "sketching"\n
+        level -> verbosity needed to print the bar"""
+        self.total = total
+        self.stage = stage
+        self.level = level
+        self.done = 0
+        self.last = None
+        self.start = time.monotonic()
+
+    def update(self, n=1):
+        self.done += n
+        now = time.monotonic()
+        if self.last == None or now - self.last >= settings["interval"] or self.done >= self.total:
+            self.last = now
+            self.report()
+
+    def report(self):
+        callback = settings["callback"]
+        if callback != None:
+            callback(self.stage, self.done, self.total)
+        elif enabled(self.level):
+            percent = 100 * self.done // self.total if self.total else 100
+            elapsed = time.monotonic() - self.start
+            sys.stderr.write(f"\r{self.stage}: {percent:3d}% {self.done}/{self.total} [{elapsed:.1f}s]")
+            sys.stderr.flush()
+
+    def close(self):
+        if self.last == None or self.done < self.total:
+            self.report()
+        if settings["callback"] == None and enabled(self.level):
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def track(iterable, total=None, stage="", level=INFO):
+    """yields the items of iterable while reporting the progress, a drop in replacement for tqdm(iterable)"""
+    if total == None:
+        total = len(iterable)
+    with progress_bar(total, stage, level) as bar:
+        for item in iterable:
+            yield item
+            bar.update()
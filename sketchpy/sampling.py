@@ -0,0 +1,125 @@
+import numpy as np
+
+
+MAX_SAMPLES = 1000
+
+
+def _segment_table(path):
+    """returns the control points of every segment as cubic bezier curves (lines and quadratic curves are
+    raised to cubic ones) along with the arc parameters, so all segments can be evaluated at once"""
+    count = len(path)
+    ctrl = np.zeros((count, 4), dtype=complex)
+    is_arc = np.zeros(count, dtype=bool)
+    arc = np.zeros((count, 7))  # center x, center y, rx, ry, rotation, theta, delta
+    linear = np.zeros(count, dtype=bool)
+
+    for n, seg in enumerate(path):
+        start, end = seg.start, seg.end
+        if hasattr(seg, "control1"):
+            ctrl[n] = (start, seg.control1, seg.control2, end)
+        elif hasattr(seg, "control"):
+            ctrl[n] = (
+                start,
+                start + 2 / 3 * (seg.control - start),
+                end + 2 / 3 * (seg.control - end),
+                end,
+            )
+        elif hasattr(seg, "radius") and start != end and seg.radius.real != 0 and seg.radius.imag != 0:
+            is_arc[n] = True
+            radius = seg.radius * getattr(seg, "radius_scale", 1)
+            arc[n] = (
+                seg.center.real,
+                seg.center.imag,
+                radius.real,
+                radius.imag,
+                np.radians(seg.rotation),
+                np.radians(seg.theta),
+                np.radians(seg.delta),
+            )
+            ctrl[n] = (start, start, end, end)
+        else:
+            # lines, close and move commands, only the end point is needed
+            linear[n] = True
+            ctrl[n] = (start, start + (end - start) / 3, start + 2 * (end - start) / 3, end)
+
+    return ctrl, is_arc, arc, linear
+
+
+def sample_counts(ctrl, is_arc, arc, linear, tolerance):
+    """number of samples needed for each segment so that the distance between the curve and the
+    sampled polyline stays below the tolerance"""
+    # Wang's formula, the second differences of the control points bound the curvature of a cubic
+    dd = np.maximum(
+        np.abs(ctrl[:, 0] - 2 * ctrl[:, 1] + ctrl[:, 2]),
+        np.abs(ctrl[:, 1] - 2 * ctrl[:, 2] + ctrl[:, 3]),
+    )
+    n = np.ceil(np.sqrt(0.75 * dd / tolerance))
+
+    # for arcs the sagitta r * theta^2 / 8 has to stay below the tolerance
+    r = np.maximum(np.abs(arc[:, 2]), np.abs(arc[:, 3]))
+    step = np.sqrt(8 * tolerance / np.maximum(r, 1e-12))
+    n = np.where(is_arc, np.ceil(np.abs(arc[:, 6]) / step), n)
+
+    n = np.where(linear, 1, n)
+    return np.clip(n, 1, MAX_SAMPLES).astype(np.int64)
+
+
+def sample_path(path, tolerance=0.5):
+    """samples every segment of a parsed svg path (svg.path or svgpathtools) in a single vectorized pass\n
+    path -> parsed path\n
+    tolerance -> maximum distance between the curve and the sampled points, in the units of the path\n
+
+    returns a complex numpy array of points, each segment is sampled at t in (0, 1] so the end points of the
+    segments are never repeated"""
+    if len(path) == 0:
+        return np.zeros(0, dtype=complex)
+
+    ctrl, is_arc, arc, linear = _segment_table(path)
+    n = sample_counts(ctrl, is_arc, arc, linear, tolerance)
+
+    seg = np.repeat(np.arange(len(n)), n)
+    first = np.repeat(np.cumsum(n) - n, n)
+    t = (np.arange(len(seg)) - first + 1) / n[seg]
+    return _evaluate(ctrl, is_arc, arc, seg, t)
+
+
+def sample_segments(path, tolerance=0.5):
+    """samples every segment of a parsed svg path separately, including its start point\n
+    path -> parsed path\n
+    tolerance -> maximum distance between the curve and the sampled points, in the units of the path\n
+
+    returns (points, offsets), points is a complex numpy array and segment i is points[offsets[i]:offsets[i + 1]]"""
+    if len(path) == 0:
+        return np.zeros(0, dtype=complex), np.zeros(1, dtype=np.int64)
+
+    ctrl, is_arc, arc, linear = _segment_table(path)
+    n = sample_counts(ctrl, is_arc, arc, linear, tolerance)
+
+    offsets = np.zeros(len(n) + 1, dtype=np.int64)
+    np.cumsum(n + 1, out=offsets[1:])
+    seg = np.repeat(np.arange(len(n)), n + 1)
+    t = (np.arange(len(seg)) - offsets[seg]) / n[seg]
+    return _evaluate(ctrl, is_arc, arc, seg, t), offsets
+
+
+def _evaluate(ctrl, is_arc, arc, seg, t):
+    """points of the segments seg at the parameters t"""
+    c = ctrl[seg]
+    u = 1 - t
+    pts = (
+        (u ** 3) * c[:, 0]
+        + (3 * u * u * t) * c[:, 1]
+        + (3 * u * t * t) * c[:, 2]
+        + (t ** 3) * c[:, 3]
+    )
+
+    on_arc = is_arc[seg]
+    if on_arc.any():
+        a = arc[seg[on_arc]]
+        angle = a[:, 5] + a[:, 6] * t[on_arc]
+        cosr, sinr = np.cos(a[:, 4]), np.sin(a[:, 4])
+        x = cosr * np.cos(angle) * a[:, 2] - sinr * np.sin(angle) * a[:, 3] + a[:, 0]
+        y = sinr * np.cos(angle) * a[:, 2] + cosr * np.sin(angle) * a[:, 3] + a[:, 1]
+        pts[on_arc] = x + 1j * y
+
+    return pts
@@ -0,0 +1,67 @@
+import numpy as np
+
+from .reporting import log
+
+
+def segment_distance(p, a, b):
+    """distance of every point of p to the segment from a to b, all (n, 2) float arrays"""
+    ab = b - a
+    ap = p - a
+    length = (ab * ab).sum(axis=1)
+    t = np.divide((ap * ab).sum(axis=1), length, out=np.zeros(len(p)), where=length > 0)
+    d = ap - np.clip(t, 0, 1)[:, None] * ab
+    return np.sqrt((d * d).sum(axis=1))
+
+
+def rdp_mask(points, starts, ends, tolerance=1):
+    """Ramer-Douglas-Peucker run on all the polylines points[starts[i]:ends[i]] together, every round splits
+    all the polylines at their farthest point at once instead of recursing on them one by one\n
+    tolerance -> points closer than this to the simplified polyline are dropped, 0 only drops duplicate
+    and collinear points\n
+    returns a bool mask of the points to keep, the first and last point of every polyline are always kept"""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    keep = np.zeros(len(pts), dtype=bool)
+    s = np.asarray(starts, dtype=np.int64)
+    e = np.asarray(ends, dtype=np.int64) - 1
+    s, e = s[e >= s], e[e >= s]
+    keep[s] = True
+    keep[e] = True
+
+    while len(s):
+        inner = e - s - 1
+        s, e, inner = s[inner > 0], e[inner > 0], inner[inner > 0]
+        if len(s) == 0:
+            break
+        first = np.cumsum(inner) - inner
+        seg = np.repeat(np.arange(len(s)), inner)
+        idx = s[seg] + 1 + np.arange(len(seg)) - first[seg]
+        d = segment_distance(pts[idx], pts[s[seg]], pts[e[seg]])
+
+        # farthest point of every polyline, sorted by polyline and then by decreasing distance
+        best = np.lexsort((-d, seg))[first]
+        split = d[best] > tolerance
+        mid = idx[best[split]]
+        keep[mid] = True
+        s, e = np.concatenate([s[split], mid]), np.concatenate([mid, e[split]])
+    return keep
+
+
+def simplify_paths(points, offsets, tolerance=1, breaks=None, stage="simplified the paths"):
+    """removes the points that are not needed to draw the paths within tolerance pixels\n
+    points, offsets -> path i is points[offsets[i]:offsets[i + 1]]\n
+    tolerance -> maximum distance in pixels between a removed point and the simplified path, 0 only removes
+    duplicate and collinear points\n
+    breaks -> indices of the points starting a filled subpath (see pathcache.path_data), they are kept\n
+    stage -> name used when reporting the reduction\n
+    returns (points, offsets, breaks) of the simplified paths, breaks is None when it was not given"""
+    points = np.asarray(points)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    bounds = offsets if breaks is None else np.union1d(breaks, offsets)
+    keep = rdp_mask(points, bounds[:-1], bounds[1:], tolerance)
+
+    # new index of every old index, kept[i] is the no of points kept before point i
+    kept = np.zeros(len(points) + 1, dtype=np.int64)
+    np.cumsum(keep, out=kept[1:])
+    if len(points):
+        log(f"{stage}: {len(points)} -> {kept[-1]} points ({100 - 100 * kept[-1] / len(points):.0f}% fewer)")
+    return points[keep], kept[offsets], None if breaks is None else kept[np.asarray(breaks, dtype=np.int64)]
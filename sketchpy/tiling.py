@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+TILE_SIZE = 1024
+MIN_TILED_PIXELS = 4 << 20
+
+
+def bands(height, tile_size):
+    """(start, end) rows of the horizontal tiles"""
+    return [(y, min(y + tile_size, height)) for y in range(0, height, tile_size)]
+
+
+def otsu_threshold(hist):
+    """otsu threshold of a 256 bin histogram, computed like cv2.threshold does with THRESH_OTSU"""
+    eps = np.finfo(np.float32).eps
+    hist = np.asarray(hist, dtype=np.float64) / max(hist.sum(), 1)
+    mu = float((np.arange(256) * hist).sum())
+    q1 = mu1 = max_sigma = 0.0
+    max_val = 0
+    for i, p_i in enumerate(hist.tolist()):
+        mu1 *= q1
+        q1 += p_i
+        q2 = 1 - q1
+        if min(q1, q2) < eps or max(q1, q2) > 1 - eps:
+            continue
+        mu1 = (mu1 + i * p_i) / q1
+        mu2 = (mu - q1 * mu1) / q2
+        sigma = q1 * q2 * (mu1 - mu2) ** 2
+        if sigma > max_sigma:
+            max_sigma = sigma
+            max_val = i
+    return max_val
+
+
+class _union_find:
+    def __init__(self, n):
+        self.parent = np.arange(n)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+def component_mask(binary_band, min_area, tiles, workers):
+    """mask of the connected components (8-connectivity) of the dark pixels larger than min_area pixels,
+    labelled tile by tile and joined at the seams, so no full size label image is ever allocated\n
+    binary_band(start, end) -> the 0/255 uint8 binary image of the rows start to end\n
+    returns the 0/255 uint8 mask of the whole image"""
+    import cv2
+
+    def label(tile):
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(binary_band(*tile))
+        return n, stats[:, cv2.CC_STAT_AREA], labels[0].copy(), labels[-1].copy()
+
+    with ThreadPoolExecutor(workers) as pool:
+        res = list(pool.map(label, tiles))
+
+    base = np.cumsum([0] + [n for n, _, _, _ in res])
+    area = np.concatenate([a for _, a, _, _ in res]).astype(np.int64)
+    background = base[:-1]
+
+    # components touching across a seam, the bottom row of a tile against the top row of the next one
+    pairs = [np.zeros((0, 2), dtype=np.int64)]
+    for k in range(len(res) - 1):
+        bottom, top = res[k][3], res[k + 1][2]
+        for dx in (-1, 0, 1):
+            a = bottom[max(0, -dx) : len(bottom) - max(0, dx)]
+            b = top[max(0, dx) : len(top) - max(0, -dx)]
+            both = (a > 0) & (b > 0)
+            pairs.append(np.stack([a[both] + base[k], b[both] + base[k + 1]], axis=1).astype(np.int64))
+    pairs = np.unique(np.concatenate(pairs), axis=0)
+
+    # only the labels on a seam can be joined, the union find runs on them alone and
+    # every other label is its own root
+    seam_labels, seam_pairs = np.unique(pairs, return_inverse=True)
+    seam_pairs = seam_pairs.reshape(-1, 2)
+    uf = _union_find(len(seam_labels))
+    for i, j in seam_pairs.tolist():
+        uf.union(i, j)
+    roots = np.arange(base[-1], dtype=np.int64)
+    roots[seam_labels] = seam_labels[[uf.find(i) for i in range(len(seam_labels))]]
+    total = np.zeros(base[-1], dtype=np.int64)
+    np.add.at(total, roots, area)
+    keep = total[roots] > min_area
+    keep[background] = False
+
+    mask = np.empty((tiles[-1][1], len(res[0][2])), dtype=np.uint8)
+
+    def fill(k):
+        # labelling a tile again gives the same labels as the first time
+        start, end = tiles[k]
+        _, labels = cv2.connectedComponents(binary_band(start, end))
+        mask[start:end] = np.where(keep[labels + base[k]], 255, 0)
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(fill, range(len(tiles))))
+    return mask
+
+
+def tiled_sketch(img, intensity, details, blur, tile_size=TILE_SIZE, workers=None):
+    """the preprocessing of trace_from_image.processimage done tile by tile on a pool of threads\n
+    img -> grayscale image\n
+    tile_size -> no of rows of a tile, every tile is extended by twice the blur radius on both sides
+    so the two chained blurs give the same result as on the whole image\n
+    workers -> no of threads, the no of cpus by default\n
+    returns (sketch image, thresholded image) as grayscale uint8 images, the sketch image is the channel
+    shared by the 3 identical channels of the untiled version"""
+    import cv2
+
+    if workers == None:
+        workers = os.cpu_count() or 1
+    height = img.shape[0]
+    tiles = bands(height, tile_size)
+
+    with ThreadPoolExecutor(workers) as pool:
+        hist = sum(pool.map(lambda t: np.bincount(img[t[0] : t[1]].ravel(), minlength=256), tiles))
+    otsu = otsu_threshold(hist)
+
+    # THRESH_BINARY_INV, the pixels above the otsu threshold become 0
+    binary_band = lambda start, end: np.where(img[start:end] > otsu, 0, 255).astype(np.uint8)
+    mask = component_mask(binary_band, details, tiles, workers)
+
+    halo = 2 * (blur // 2)
+    out_img = np.empty(img.shape[:2], dtype=np.uint8)
+    thresh = np.empty(img.shape[:2], dtype=np.uint8)
+
+    def process(tile):
+        start, end = tile
+        a, b = max(start - halo, 0), min(end + halo, height)
+        output_image = mask[a:b]
+
+        invert = cv2.bitwise_not(output_image)
+        blurred = cv2.GaussianBlur(invert, (blur, blur), 0)
+        invertedblur = cv2.bitwise_not(blurred)
+        sketch_img = cv2.divide(output_image, invertedblur, scale=256.0)
+
+        invert = cv2.bitwise_not(sketch_img)
+        blurred = cv2.GaussianBlur(invert, (blur, blur), 0)
+        invertedblur = cv2.bitwise_not(blurred)
+        sketch = cv2.divide(sketch_img, invertedblur, scale=256.0)
+        _, th = cv2.threshold(sketch, intensity, 255, 0)
+
+        out_img[start:end] = sketch_img[start - a : end - a]
+        thresh[start:end] = th[start - a : end - a]
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(process, tiles))
+    return out_img, thresh
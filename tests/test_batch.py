@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+from sketchpy.batch import check_names, input_root, output_name
+
+
+def test_same_name_different_extension():
+    with pytest.raises(ValueError):
+        check_names(["in/face.jpg", "in/face.png"], input_root(["in/face.jpg", "in/face.png"]))
+
+
+def test_same_name_in_different_folders():
+    files = [os.path.join("in", "a", "face.jpg"), os.path.join("in", "b", "face.jpg")]
+    root = input_root(files)
+    check_names(files, root)
+    assert [output_name(f, root) for f in files] == [os.path.join("a", "face"), os.path.join("b", "face")]
+    # without a root only the file names are kept, so they collide
+    with pytest.raises(ValueError):
+        check_names(files, None)
+
+
+def test_distinct_names():
+    files = ["in/face.jpg", "in/cat.jpg", "in/sub/face2.png"]
+    check_names(files, input_root(files))
+    check_names([], None)
@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from sketchpy import models
+from sketchpy.models import model_manager, STYLES, REPO
+
+
+class stub_generator(torch.nn.Module):
+    """a one layer stand in for the AnimeGAN generator, same input and output shapes"""
+
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 3, 3, padding=1)
+
+    def forward(self, input):
+        return torch.tanh(self.conv(input))
+
+
+def stub_manager(tmp_path, **kwargs):
+    """a model_manager with stub weights for every style in tmp_path, so nothing is downloaded"""
+    torch.manual_seed(0)
+    for name in STYLES:
+        torch.save(stub_generator().state_dict(), os.path.join(tmp_path, name + ".pt"))
+    manager = model_manager(weights_dir=str(tmp_path), size=16, **kwargs)
+    manager.generator = stub_generator
+    return manager
+
+
+def example():
+    return np.random.default_rng(0).uniform(-1, 1, (2, 3, 16, 16)).astype(np.float32)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        model_manager(mode="int8")
+
+
+def test_lru_eviction(tmp_path):
+    manager = stub_manager(tmp_path, max_models=2)
+    compiled = []
+    manager.compile = lambda style_index, example: compiled.append(style_index) or object()
+
+    first = manager.get(0, None)
+    manager.get(1, None)
+    assert manager.get(0, None) is first
+    manager.get(2, None)
+    # 1 was the least recently used style
+    assert list(manager.models) == [0, 2]
+    manager.get(1, None)
+    assert list(manager.models) == [2, 1]
+    assert compiled == [0, 1, 2, 1]
+
+
+@pytest.mark.parametrize("mode", ["channels_last", "torchscript"])
+def test_modes_match_eager(tmp_path, mode):
+    batch = example()
+    expected = stub_manager(tmp_path).get(0, batch)(batch)
+    out = stub_manager(tmp_path, mode=mode).get(0, batch)(batch)
+    assert out.shape == batch.shape
+    np.testing.assert_allclose(out, expected, atol=1e-5)
+
+
+def test_torchscript_is_saved_and_reused(tmp_path):
+    batch = example()
+    manager = stub_manager(tmp_path, mode="torchscript")
+    expected = manager.get(0, batch)(batch)
+    assert os.path.exists(manager.converted(0, "pt"))
+
+    # a new manager loads the saved model without building the generator
+    manager = model_manager(weights_dir=str(tmp_path), size=16, mode="torchscript")
+    manager.load = None
+    np.testing.assert_allclose(manager.get(0, batch)(batch), expected, atol=1e-5)
+
+
+def test_onnx_matches_eager(tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+    batch = example()
+    expected = stub_manager(tmp_path).get(0, batch)(batch)
+    manager = stub_manager(tmp_path, mode="onnx")
+    np.testing.assert_allclose(manager.get(0, batch)(batch), expected, atol=1e-4)
+    assert os.path.exists(manager.converted(0, "onnx"))
+
+
+def test_hub_fallback(tmp_path, monkeypatch):
+    manager = stub_manager(tmp_path)
+    manager.generator = None
+    calls = []
+
+    def hub_load(repo, entry, **kwargs):
+        calls.append(repo)
+        return stub_generator()
+
+    monkeypatch.setattr(torch.hub, "get_dir", lambda: str(tmp_path / "hub"))
+    monkeypatch.setattr(torch.hub, "load", hub_load)
+    manager.load(0)
+    manager.load(1)
+    # the repo is only looked up for the first model, without a local copy it comes from github
+    assert calls == [REPO]
+    assert manager.generator is stub_generator
+
+
+def test_shared_manager():
+    manager = model_manager()
+    assert models.get_models(manager) is manager
+    assert models.get_models() is models.get_models(True)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from sketchpy.pathcache import path_data, save_paths, load_paths, read_paths, is_path_file, VERSION
+
+
+def sample_data():
+    points = np.array([[0, 0], [10, 0], [10, 10], [0, 0], [5, 5], [6, 5], [5, 5], [-3, 7], [8, -2]], dtype=np.int32)
+    offsets = np.array([0, 7, 9], dtype=np.int64)
+    colors = np.array([[1, 0.5, 0], [0.25, 0.75, 1]], dtype=np.float32)
+    return path_data(points, offsets, colors, 480, 640, 0.75)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(tmp_path, mmap):
+    data = sample_data()
+    file_name = str(tmp_path / "paths.npy")
+    save_paths(file_name, data)
+    assert is_path_file(file_name)
+    loaded = load_paths(file_name, mmap=mmap)
+    np.testing.assert_array_equal(loaded.points, data.points)
+    np.testing.assert_array_equal(loaded.offsets, data.offsets)
+    np.testing.assert_array_equal(loaded.colors, data.colors)
+    np.testing.assert_array_equal(loaded.breaks, data.breaks)
+    assert (loaded.height, loaded.width, loaded.scale) == (480, 640, 0.75)
+    assert list(loaded) == list(data)
+    assert [len(s) for s in loaded.subpaths(0)] == [4, 3]
+
+
+def test_newer_version_is_refused(tmp_path):
+    file_name = str(tmp_path / "paths.npy")
+    save_paths(file_name, sample_data())
+    buf = np.load(file_name)
+    buf[1] = VERSION + 1
+    np.save(file_name, buf)
+    with pytest.raises(ValueError):
+        load_paths(file_name)
+
+
+def test_pickled_data_needs_allow_pickle(tmp_path):
+    file_name = str(tmp_path / "old.npy")
+    old = [[480, 640, 0.75], ([(0, 0), (10, 0), (10, 10)], (1.0, 0.5, 0.0))]
+    np.save(file_name, np.array(old, dtype=object), allow_pickle=True)
+    assert not is_path_file(file_name)
+    with pytest.raises(ValueError):
+        read_paths(file_name)
+    assert read_paths(file_name, allow_pickle=True).tolist() == old
+
+
+def test_read_paths(tmp_path):
+    file_name = str(tmp_path / "paths.npy")
+    save_paths(file_name, sample_data())
+    np.testing.assert_array_equal(read_paths(file_name).points, sample_data().points)
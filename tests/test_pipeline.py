@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+import pytest
+
+from sketchpy.pipeline import imap_ordered, sample_svg
+
+
+def slow_square(x):
+    # the early items finish last, the results still have to come back in order
+    time.sleep(0.02 * (5 - x % 5))
+    return x * x
+
+
+def counted(n, consumed):
+    for i in range(n):
+        consumed.append(i)
+        yield i
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_imap_ordered_keeps_the_order(workers):
+    assert list(imap_ordered(slow_square, range(12), workers)) == [x * x for x in range(12)]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_imap_ordered_backpressure(workers):
+    consumed = []
+    results = imap_ordered(slow_square, counted(20, consumed), workers)
+    for n in range(5):
+        assert next(results) == n * n
+        # at most 2 * workers items are in flight ahead of the results handed out
+        assert len(consumed) <= n + 1 + max(2 * workers - 1, 0)
+    results.close()
+    assert len(consumed) < 20
+
+
+def test_sample_svg():
+    pytest.importorskip("svg.path")
+    from svg.path import parse_path
+
+    attributes = [
+        {"d": "M 10 10 C 100 -50 300 400 390 20", "fill": "#ff0000", "transform": "translate(5,7)"},
+        {"d": "not a path", "fill": "#00ff00", "transform": "translate(0,0)"},
+        {"d": "M 100 100 A 80 40 0 1 1 300 200", "fill": "#0000ff", "transform": "translate(0,0)"},
+        {"d": "M 0 0 Q 200 300 400 0", "fill": "#123", "transform": "translate(-3,2)"},
+    ]
+    # with the scale equal to the size, the points are only translated and rounded down
+    points, offsets, colors, breaks = sample_svg(attributes, 400, 400, 400, 0.25, chunk_size=1)
+    assert len(offsets) == 4
+    np.testing.assert_allclose(colors, [(1, 0, 0), (0, 0, 1), (0x11 / 255, 0x22 / 255, 0x33 / 255)], atol=1e-6)
+    for n, i in enumerate([0, 2, 3]):
+        path = parse_path(attributes[i]["d"])
+        dx, dy = map(int, attributes[i]["transform"][10:-1].split(","))
+        dense = np.array([path.point(t) for t in np.linspace(0, 1, 4000)]) + complex(dx, dy)
+        pts = points[offsets[n] : offsets[n + 1]]
+        sampled = pts[:, 0] + 1j * pts[:, 1]
+        # every sampled point is on the curve, up to the rounding to whole pixels
+        assert np.abs(sampled[:, None] - dense).min(axis=1).max() < 1.5
+        # and the curve is covered up to its end point
+        assert abs(sampled[-1] - dense[-1]) < 1.5
+
+    batch = sample_svg(attributes, 400, 400, 400, 0.25, workers=2, chunk_size=1)
+    for a, b in zip(batch, (points, offsets, colors, breaks)):
+        np.testing.assert_array_equal(a, b)
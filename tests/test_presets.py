@@ -0,0 +1,66 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from sketchpy.presets import load_index, load_preset, load_text, pack_preset, preset_data, split_markers
+
+
+# sha256 of the coordinate literals the library classes held before they were packed into assets,
+# hashed part by part as the part name, the int16 points and the stroke offsets
+LITERALS = {
+    "apj": "46353797a8103474e7fbc67bc38e1048193a3270c5f581735d2ae04636907ec9",
+    "bts": "08fa7ea6648ab12e90a6d7dd02060e7c1314a9f9a0052e2f65f601a7a1b29153",
+    "gojo": "6e019adf0621a6788af8f3bb57c545f0baf24004c6e8ce5544b7b94eb0decb21",
+    "flag": "212844975a6df73a698954d0dab59bb4eaf71c36edc7a7ea6bc39fc772431a1b",
+    "rdj": "7112917cbf3cfeb69a4613fcde78d3493c49a58826d7bca55791e3a7de48e576",
+    "vijay": "fe7ae8bb04ba12b284b1a526cef59ef9373adcb8d95b6203b8591c97683fe1b4",
+    "tom_holland": "80b6340670abc75ce7e37beab8321cfeb1b375c41d00ca260670445a71f98204",
+}
+IRONMAN_TEXT = "223ec61e777cb7a21ebde96c945242559530c2858a7e3e0d849ac66351c0a785"
+
+
+def digest(preset):
+    sha = hashlib.sha256()
+    for part in preset.names():
+        offsets = np.asarray(preset.parts[part], dtype=np.int64)
+        sha.update(part.encode())
+        sha.update(np.ascontiguousarray(preset.points[offsets[0] : offsets[-1]], dtype=np.int16).tobytes())
+        sha.update(offsets - offsets[0])
+    return sha.hexdigest()
+
+
+@pytest.mark.parametrize("name", sorted(LITERALS))
+def test_assets_match_the_old_literals(name):
+    assert digest(load_preset(name)) == LITERALS[name]
+
+
+def test_ascii_asset_matches_the_old_literal():
+    assert hashlib.sha256("".join(load_text("ironman_ascii")).encode()).hexdigest() == IRONMAN_TEXT
+
+
+def test_pack_preset(tmp_path):
+    coord = [(1, 2), (3, 4), (-1, -1), (5, 6), (7, 8), (9, 10), (-1, -1)]
+    pack_preset("test", {"a": coord, "b": [(0, 0), (-200, 300)]}, str(tmp_path))
+    pack_preset("text", ["ab\n", "cd\n"], str(tmp_path))
+    index = load_index(str(tmp_path))
+    assert index["text"] == {"file": "text.txt"}
+    points = np.load(str(tmp_path / index["test"]["file"]), allow_pickle=False)
+    assert points.dtype == np.int16
+    preset = preset_data("test", points, index["test"]["parts"])
+    assert preset.names() == ["a", "b"]
+    assert [s.tolist() for s in preset["a"]] == [[[1, 2], [3, 4]], [[5, 6], [7, 8], [9, 10]]]
+    assert [s.tolist() for s in preset["b"]] == [[[0, 0], [-200, 300]]]
+
+
+def test_load_preset():
+    preset = load_preset("rdj")
+    assert load_preset("rdj") is preset
+    assert "face" in preset and "hat" not in preset
+    with pytest.raises(ValueError):
+        load_preset("missing")
+
+
+def test_split_markers_range():
+    with pytest.raises(ValueError):
+        split_markers([(0, 40000)])
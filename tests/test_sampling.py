@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("svg.path")
+from svg.path import parse_path
+
+from sketchpy.sampling import sample_path, sample_segments
+
+
+PATHS = [
+    "M 10 10 L 200 40 L 120 300 Z",
+    "M 0 0 C 100 -200 300 400 400 0 S 700 -100 800 200",
+    "M 50 50 Q 300 -100 400 200 T 600 300",
+    "M 100 100 A 120 60 30 1 1 400 250 A 40 40 0 0 0 300 300",
+    "M 10 10 h 50 v 50 h -50 z m 100 0 c 20 0 40 20 40 40 l -40 0 z",
+]
+
+
+def polyline_distance(points, line):
+    """distance of every point to the polyline going through line"""
+    a, b = line[:-1], line[1:]
+    ab = b - a
+    length = np.maximum(np.abs(ab) ** 2, 1e-24)
+    t = np.clip(((points[:, None] - a).conj() * ab).real / length, 0, 1)
+    return np.abs(points[:, None] - (a + t * ab)).min(axis=1)
+
+
+@pytest.mark.parametrize("d", PATHS)
+@pytest.mark.parametrize("tolerance", [0.1, 0.5, 2])
+def test_segments_follow_the_curve(d, tolerance):
+    path = parse_path(d)
+    points, offsets = sample_segments(path, tolerance)
+    assert len(offsets) == len(path) + 1
+    for n, seg in enumerate(path):
+        pts = points[offsets[n] : offsets[n + 1]]
+        # the samples are points of the segment, at evenly spaced parameters
+        t = np.linspace(0, 1, len(pts))
+        expected = np.array([seg.point(x) for x in t])
+        np.testing.assert_allclose(pts, expected, atol=1e-6)
+        if len(pts) > 1:
+            dense = np.array([seg.point(x) for x in np.linspace(0, 1, 400)])
+            assert polyline_distance(dense, pts).max() <= tolerance * 1.01
+
+
+@pytest.mark.parametrize("d", PATHS)
+def test_path_matches_segments(d):
+    path = parse_path(d)
+    points, offsets = sample_segments(path, 0.5)
+    # sample_path drops the start point of every segment, it is the end point of the previous one
+    keep = np.ones(len(points), dtype=bool)
+    keep[offsets[:-1]] = False
+    np.testing.assert_allclose(sample_path(path, 0.5), points[keep], atol=1e-9)
+
+
+def test_empty_path():
+    assert len(sample_path(parse_path(""))) == 0
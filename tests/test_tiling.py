@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from sketchpy import canvas
+from sketchpy.renderer import raster_renderer
+from sketchpy.tiling import bands, otsu_threshold, tiled_sketch
+
+
+IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "images", "rdj.jpg")
+
+
+def tracer(path, **kwargs):
+    return canvas.trace_from_image(path, renderer=raster_renderer(), tile_size=0, **kwargs)
+
+
+@pytest.mark.parametrize("tile_size", [37, 128, 100000])
+@pytest.mark.parametrize("details,blur", [(50, 51), (0, 5)])
+def test_tiles_match_the_whole_image(tile_size, details, blur):
+    obj = tracer(IMAGE, details=details, blur=blur)
+    img, thresh = obj.sketch_image()
+    tiled_img, tiled_thresh = tiled_sketch(obj.src, obj.intensity, details, blur, tile_size, workers=3)
+    np.testing.assert_array_equal(tiled_img, img[:, :, 0] if img.ndim == 3 else img)
+    np.testing.assert_array_equal(tiled_thresh, thresh)
+
+
+def test_components_joined_across_seams(tmp_path):
+    # a thin diagonal line crossing many seams is one component larger than details,
+    # while every piece of it inside a tile is smaller
+    src = np.full((200, 200), 255, dtype=np.uint8)
+    for i in range(200):
+        src[i, i] = 0
+    src[50:52, 150:152] = 0
+    path = str(tmp_path / "line.png")
+    cv2.imwrite(path, src)
+    obj = tracer(path, details=30, blur=5)
+    img, thresh = obj.sketch_image()
+    tiled_img, tiled_thresh = tiled_sketch(obj.src, obj.intensity, 30, 5, 10)
+    np.testing.assert_array_equal(tiled_img, img[:, :, 0])
+    np.testing.assert_array_equal(tiled_thresh, thresh)
+
+
+def test_otsu_matches_opencv():
+    src = cv2.imread(IMAGE, 0)
+    threshold, _ = cv2.threshold(src, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    assert otsu_threshold(np.bincount(src.ravel(), minlength=256)) == threshold
+
+
+def test_bands():
+    assert bands(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert bands(8, 4) == [(0, 4), (4, 8)]